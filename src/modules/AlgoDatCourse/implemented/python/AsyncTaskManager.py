@@ -0,0 +1,164 @@
+import asyncio
+import inspect
+import time
+from collections import deque
+
+from TaskManager import Task, TaskManager
+
+
+class AsyncTask(Task):
+    __slots__ = ("job", "result", "error")
+
+    def __init__(self, name: str, priority: int, job=None):
+        super().__init__(name, priority)
+        self.job = job        # Coroutine oder Coroutine-Funktion, von run() ausgeführt
+        self.result = None
+        self.error = None
+
+
+class AsyncTaskManager(TaskManager):
+    """
+    TaskManager für asyncio. Gleicher Heap aus [schlüssel, counter, task_id,
+    task, eingereiht] wie TaskManager, also höchste (mit aging > 0 gealterte)
+    Priorität zuerst und FIFO bei Gleichstand; update_priority und cancel
+    funktionieren unverändert. Wartende get()- und put()-Aufrufe parken wie
+    bei asyncio.Queue auf Futures; bei maxsize > 0 bremst put() die
+    Producer, bis wieder Platz ist.
+
+    run(concurrency) startet einen Worker-Pool, der die Jobs der Aufgaben in
+    Prioritätsreihenfolge ausführt, höchstens concurrency gleichzeitig.
+    """
+    def __init__(self, maxsize: int = 0, aging: float = 0.0, clock=time.monotonic):
+        super().__init__(aging, clock)
+        self.maxsize = maxsize
+        self._getters: deque[asyncio.Future] = deque()
+        self._putters: deque[asyncio.Future] = deque()
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._entries)
+
+    def qsize(self) -> int:
+        return len(self._entries)
+
+    def put_nowait(self, name: str, priority: int, job=None) -> int:
+        if self.full():
+            raise asyncio.QueueFull
+        task_id = self._push(AsyncTask(name, priority, job))
+        self._unfinished += 1
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+        return task_id
+
+    def get_nowait(self) -> AsyncTask:
+        if not self._entries:
+            raise asyncio.QueueEmpty
+        return self.get_next_task()
+
+    # Die Methoden von TaskManager bleiben nutzbar und führen Zähler und Wartende mit
+    def add_task(self, name: str, priority: int) -> int:
+        return self.put_nowait(name, priority)
+
+    def get_next_task(self) -> AsyncTask:
+        task = super().get_next_task()  # IndexError bei leerem Heap
+        self._wakeup_next(self._putters)
+        return task
+
+    async def put(self, name: str, priority: int, job=None) -> int:
+        while self.full():
+            await self._wait(self._putters, self.full)
+        return self.put_nowait(name, priority, job)
+
+    async def get(self) -> AsyncTask:
+        while not self._entries:
+            await self._wait(self._getters, lambda: not self._entries)
+        return self.get_nowait()
+
+    def cancel(self, task_id: int) -> AsyncTask:
+        """Entfernt die Aufgabe; für join() zählt sie damit als erledigt."""
+        task = super().cancel(task_id)
+        self._wakeup_next(self._putters)
+        self.task_done()
+        return task
+
+    def task_done(self) -> None:
+        if self._unfinished <= 0:
+            raise ValueError("task_done() zu oft aufgerufen")
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self) -> None:
+        await self._finished.wait()
+
+    async def run(self, concurrency: int = 8) -> list[AsyncTask]:
+        """
+        Arbeitet alle Aufgaben ab, auch solche, die Jobs währenddessen
+        einstellen. Ergebnis bzw. Ausnahme landen in task.result/task.error;
+        zurück kommt die Liste der Aufgaben in Fertigstellungsreihenfolge.
+        """
+        done: list[AsyncTask] = []
+
+        async def worker():
+            while True:
+                task = await self.get()
+                try:
+                    job = task.job() if callable(task.job) else task.job
+                    task.result = await job if inspect.isawaitable(job) else job
+                except Exception as error:
+                    task.error = error
+                finally:
+                    done.append(task)
+                    self.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            await self.join()
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        return done
+
+    async def _wait(self, waiters: deque, still_blocked) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            # Wurden wir geweckt und dann abgebrochen, den nächsten Wartenden wecken
+            if not still_blocked() and not waiter.cancelled():
+                self._wakeup_next(waiters)
+            raise
+
+    @staticmethod
+    def _wakeup_next(waiters: deque) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+
+if __name__ == "__main__":
+
+    async def job(name: str) -> str:
+        await asyncio.sleep(0.01)
+        return f"{name} erledigt"
+
+    async def main():
+        manager = AsyncTaskManager(maxsize=10)
+        for name, priority in [("E-Mails", 2), ("Server neu starten", 10), ("Backup", 5), ("Monitoring", 5)]:
+            await manager.put(name, priority, lambda name=name: job(name))
+        for task in await manager.run(concurrency=1):
+            print(task, "->", task.result)
+
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+"""
+Auswahl zwischen reinem Python und NumPy fuer Countingsort und Radixsort.
+
+backend="python" nimmt die Python-Schleifen, backend="numpy" die
+vektorisierte Variante. Bei "auto" wird NumPy verwendet, wenn es installiert
+ist und die Eingabe schon als Puffer (array.array oder ndarray) vorliegt;
+normale Listen bleiben beim Python-Pfad. Beide Pfade liefern dieselben Werte
+im selben Containertyp wie die Eingabe.
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BACKENDS = ("auto", "python", "numpy")
+
+
+def resolve(backend, A):
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Unbekanntes Backend: {backend!r}, erlaubt sind {BACKENDS}")
+
+    if backend == "numpy" and np is None:
+        raise ImportError("backend='numpy' benoetigt NumPy")
+
+    if backend == "auto":
+        if np is not None and isinstance(A, (array, np.ndarray)):
+            return "numpy"
+        return "python"
+
+    return backend
+
+
+def to_numpy(A):
+
+    if isinstance(A, np.ndarray):
+        a = A
+    elif isinstance(A, array):
+        a = np.frombuffer(A, dtype=np.dtype(A.typecode))
+    elif len(A) == 0:
+        a = np.zeros(0, dtype=np.int64)
+    else:
+        a = np.asarray(A)
+
+    if a.dtype.kind not in "iu":
+        raise TypeError(f"Ganzzahlige Eingabe erwartet, nicht {a.dtype}")
+
+    return a
+
+
+def like(B, A):
+    """Gibt das Ergebnis B (Liste oder ndarray) im Containertyp von A zurueck."""
+
+    if np is not None and isinstance(A, np.ndarray):
+        return np.asarray(B, dtype=A.dtype)
+
+    if isinstance(A, array):
+        if np is not None and isinstance(B, np.ndarray):
+            return array(A.typecode, B.astype(np.dtype(A.typecode), copy=False).tobytes())
+        return array(A.typecode, B)
+
+    if np is not None and isinstance(B, np.ndarray):
+        return B.tolist()
+
+    return B
@@ -0,0 +1,802 @@
+"""
+Benchmarks fuer die Python-Implementierungen.
+
+Aufruf:  python Benchmark.py <suite> [--sizes 1000 10000 ...] [--repeat 3]
+
+Groessere Eingaben (z. B. 10**7) einfach ueber --sizes angeben.
+
+Die Suite "matrix" laeuft ueber alle Implementierungen, Groessen und
+Verteilungen und misst Zeit, Vergleiche, Schreibzugriffe, Vertauschungen,
+Allokationen, Rekursionstiefe und Spitzenspeicher (Zaehler aus Instrumentation.py):
+
+    python Benchmark.py matrix --json ergebnis.json
+    python Benchmark.py matrix --baseline ergebnis.json --threshold 0.2
+
+Mit --baseline wird jede Zelle gegen den gespeicherten Lauf verglichen;
+liegt ein Wert mehr als --threshold (relativ) darueber, gilt das als
+Regression und der Exit-Code ist 1.
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import os
+import platform
+import random
+import threading
+import time
+import tracemalloc
+
+import Instrumentation
+from AsyncTaskManager import AsyncTaskManager
+from BucketTaskManager import BucketTaskManager, RadixHeap
+from CompactRBTree import CompactRBTree
+from CompactTaskManager import CompactTaskManager
+from Countingsort import Countingsort
+from Heapsort import Heapsort
+from IndexedHeap import IndexedMinHeap
+from MaxHeap import MaxHeap
+from Mergesort import Mergesort
+from MinHeap import MinHeap
+from MinMaxHeap import MinMaxHeap
+from PairingHeap import PairingHeap
+from Quicksort import Quicksort
+from Radixsort import Radixsort
+from RBTree import RBTree
+from Selectionsort import Selectionsort
+from TaskManager import ConcurrentTaskManager, TaskManager
+from TaskMaxHeap import FastTaskMaxHeap, TaskManual, TaskMaxHeap
+
+
+""" EINGABEDATEN """
+
+DISTRIBUTIONS = ("random", "sorted", "reversed", "few_unique", "zipf")
+
+
+def make_input(distribution, n, seed=0):
+
+    rng = random.Random(seed)
+
+    if distribution == "random":
+        return [rng.randrange(n * 10) for _ in range(n)]
+    if distribution == "sorted":
+        return list(range(n))
+    if distribution == "reversed":
+        return list(range(n, 0, -1))
+    if distribution == "few_unique":
+        return [rng.randrange(8) for _ in range(n)]
+    if distribution == "zipf":
+        # Wert k mit Gewicht 1 / k^1.1: wenige Werte sehr haeufig, langer Schwanz
+        weights = [1 / k ** 1.1 for k in range(1, n + 1)]
+        return rng.choices(range(1, n + 1), weights, k=n)
+
+    raise ValueError(f"Unbekannte Verteilung: {distribution}")
+
+
+def measure(fn, data, repeat):
+    """Bester Lauf aus `repeat` Wiederholungen, jeweils auf einer frischen Kopie."""
+
+    best = float("inf")
+
+    for _ in range(repeat):
+        A = list(data)
+        start = time.perf_counter()
+        fn(A)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def bytes_per_item(build, n):
+    """Mit tracemalloc gemessener Speicher der von build() erzeugten Struktur pro Element."""
+
+    tracemalloc.start()
+    try:
+        structure = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del structure
+
+    return current / max(1, n)
+
+
+def print_row(*cells):
+    print("  ".join(f"{c:>14}" for c in cells))
+
+
+def make_graph(edges, seed=0):
+    """Zufaelliger gerichteter Graph mit edges Kanten und edges // 10 Knoten."""
+
+    rng = random.Random(seed)
+    n = max(2, edges // 10)
+    adj = [[] for _ in range(n)]
+
+    for _ in range(edges):
+        adj[rng.randrange(n)].append((rng.randrange(n), rng.randint(1, 100)))
+
+    return adj
+
+
+""" ZAEHLER """
+
+
+def count_operations(fn, data, comparison_based=True):
+    """Ereigniszaehler (siehe Instrumentation.py) fuer einen Lauf von fn auf instrumentierten Daten."""
+
+    counter = Instrumentation.Counter()
+
+    with Instrumentation.Session(counter) as session:
+        fn(session.list(data, wrap=comparison_based))
+
+    return counter
+
+
+def peak_bytes(fn, data):
+
+    A = list(data)
+    tracemalloc.start()
+    try:
+        fn(A)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+""" DIJKSTRA-VARIANTEN """
+
+
+def dijkstra_heapq(adj, source):
+    """Lazy Deletion: veraltete Eintraege bleiben im Heap und werden beim Pop uebersprungen."""
+
+    dist = [None] * len(adj)
+    dist[source] = 0
+    heap = [(0, source)]
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for v, w in adj[u]:
+            nd = d + w
+            if dist[v] is None or nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+
+    return dist
+
+
+def dijkstra_indexed(adj, source):
+    """Decrease-Key ueber die Handles des IndexedMinHeap, jeder Knoten steht hoechstens einmal im Heap."""
+
+    dist = [None] * len(adj)
+    dist[source] = 0
+    handle = [None] * len(adj)
+    heap = IndexedMinHeap()
+    handle[source] = heap.insert(0, source)
+
+    while len(heap):
+        d, u = heap.extractMin()
+        for v, w in adj[u]:
+            nd = d + w
+            if dist[v] is None:
+                dist[v] = nd
+                handle[v] = heap.insert(nd, v)
+            elif nd < dist[v]:
+                dist[v] = nd
+                heap.update(handle[v], nd)
+
+    return dist
+
+
+def dijkstra_minheap(adj, source):
+    """Wie dijkstra_heapq (Lazy Deletion), aber auf dem eigenen MinHeap im fast-Modus."""
+
+    dist = [None] * len(adj)
+    dist[source] = 0
+    heap = MinHeap([(0, source)], fast=True)
+
+    while heap.heapSize:
+        d, u = heap.extractMin()
+        if d > dist[u]:
+            continue
+        for v, w in adj[u]:
+            nd = d + w
+            if dist[v] is None or nd < dist[v]:
+                dist[v] = nd
+                heap.insert_many([(nd, v)])
+
+    return dist
+
+
+def dijkstra_pairing(adj, source):
+    """Decrease-Key ueber die Knoten-Handles des PairingHeap."""
+
+    dist = [None] * len(adj)
+    dist[source] = 0
+    node = [None] * len(adj)
+    heap = PairingHeap()
+    node[source] = heap.insert(0, source)
+
+    while len(heap):
+        d, u = heap.extractMin()
+        for v, w in adj[u]:
+            nd = d + w
+            if dist[v] is None:
+                dist[v] = nd
+                node[v] = heap.insert(nd, v)
+            elif nd < dist[v]:
+                dist[v] = nd
+                heap.decreaseKey(node[v], nd)
+
+    return dist
+
+
+def dijkstra_radix(adj, source):
+    """Lazy Deletion auf dem RadixHeap; die entnommenen Distanzen steigen monoton."""
+
+    dist = [None] * len(adj)
+    dist[source] = 0
+    heap = RadixHeap()
+    heap.insert(0, source)
+
+    while len(heap):
+        d, u = heap.extractMin()
+        if d > dist[u]:
+            continue
+        for v, w in adj[u]:
+            nd = d + w
+            if dist[v] is None or nd < dist[v]:
+                dist[v] = nd
+                heap.insert(nd, v)
+
+    return dist
+
+
+""" MATRIX """
+
+METRICS = ("time", "comparisons", "moves", "swaps", "allocations", "max_depth", "peak_bytes")
+
+
+def build_matrix():
+    """Name -> (Funktion auf einer Liste, vergleichsbasiert?, groesstes sinnvolles n)."""
+
+    qs = Quicksort()
+    ms = Mergesort()
+
+    def pairing(A):
+        heap = PairingHeap()
+        for x in A:
+            heap.insert(x)
+        while len(heap):
+            heap.extractMin()
+
+    def rbtree(A):
+        tree = RBTree()
+        for x in A:
+            tree.insert(x)
+        for x in A:
+            tree.delete(x)
+
+    def task_manager(A):
+        m = TaskManager()
+        for p in A:
+            m.add_task("aufgabe", p)
+        while not m.is_empty():
+            m.get_next_task()
+
+    def task_max_heap(A):
+        h = TaskMaxHeap()
+        for p in A:
+            h.insert(TaskManual("aufgabe", p))
+        while not h.is_empty():
+            h.extract_max()
+
+    def min_heap(A):
+        heap = MinHeap(A)
+        while heap.heapSize:
+            heap.extractMin()
+
+    def max_heap(A):
+        heap = MaxHeap(A)
+        while heap.heapSize:
+            heap.extractMax()
+
+    def min_max_heap(A):
+        heap = MinMaxHeap(A)
+        while len(heap):
+            heap.pop_min()
+
+    return {
+        "quicksort": (lambda A: qs.quicksort(A, 0, len(A) - 1), True, None),
+        "introsort": (qs.introsort, True, None),
+        "mergesort": (lambda A: ms.mergesort(A, 0, len(A) - 1), True, None),
+        "mergesort_bottom_up": (ms.mergesort_bottom_up, True, None),
+        "heapsort": (Heapsort().heapsort, True, None),
+        "selectionsort": (Selectionsort().selectionsort, True, 5000),
+        "countingsort": (Countingsort().countingsort, False, None),
+        "radixsort": (Radixsort().radixsort, False, None),
+        "MinHeap": (min_heap, True, None),
+        "MaxHeap": (max_heap, True, None),
+        "MinMaxHeap": (min_max_heap, True, None),
+        "PairingHeap": (pairing, True, None),
+        "RBTree": (rbtree, True, None),
+        "TaskManager": (task_manager, True, None),
+        "TaskMaxHeap": (task_max_heap, True, None),
+    }
+
+
+def run_cell(name, fn, comparison_based, distribution, n, repeat):
+
+    data = make_input(distribution, n)
+    cell = {"impl": name, "distribution": distribution, "n": n}
+
+    try:
+        time_ = measure(fn, data, repeat)
+        peak = peak_bytes(fn, data)
+    except RecursionError:
+        # z. B. klassischer Quicksort auf sortierter Eingabe
+        cell["error"] = "RecursionError"
+        return cell
+
+    cell.update(time=time_, peak_bytes=peak)
+
+    try:
+        counter = count_operations(fn, data, comparison_based)
+    except RecursionError:
+        # Zeit und Speicher bleiben gueltig, nur die Zaehler fehlen
+        cell["count_error"] = "RecursionError"
+        counter = None
+
+    def count(kind, applies=True):
+        return counter[kind] if counter is not None and applies else None
+
+    cell.update(
+        # Counting-/Radixsort vergleichen nicht und schreiben in eine neue Liste
+        comparisons=count("compare", comparison_based),
+        moves=count("move", comparison_based),
+        swaps=count("swap", comparison_based),
+        allocations=count("alloc"),
+        max_depth=None if counter is None else counter.max_depth,
+    )
+
+    return cell
+
+
+def compare_to_baseline(results, baseline, threshold):
+    """Liste der Regressionen: (Zelle, Metrik, alt, neu) fuer alle Werte > (1 + threshold) * alt."""
+
+    old = {(c["impl"], c["distribution"], c["n"]): c for c in baseline["results"]}
+    regressions = []
+
+    for cell in results:
+        before = old.get((cell["impl"], cell["distribution"], cell["n"]))
+        if before is None:
+            continue
+        for metric in METRICS:
+            a, b = before.get(metric), cell.get(metric)
+            if a is not None and b is not None and b > (1 + threshold) * a:
+                regressions.append((cell, metric, a, b))
+
+    return regressions
+
+
+""" SUITES """
+
+
+def bench_mergesort(args):
+
+    ms = Mergesort()
+
+    variants = {
+        "top-down": lambda A: ms.mergesort(A, 0, len(A) - 1),
+        "bottom-up": ms.mergesort_bottom_up,
+        "sorted()": sorted,
+    }
+
+    print_row("verteilung", "n", *variants)
+
+    for distribution in args.distributions:
+        for n in args.sizes:
+            data = make_input(distribution, n)
+            times = [measure(fn, data, args.repeat) for fn in variants.values()]
+            print_row(distribution, n, *(f"{t:.4f}s" for t in times))
+
+
+def bench_parallel(args):
+
+    ms = Mergesort()
+    rs = Radixsort()
+
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, cpus} & set(range(1, max(2, cpus) + 1)))
+
+    print_row("algorithmus", "n", "workers", "zeit", "speedup")
+
+    for n in args.sizes:
+
+        data = make_input("random", n)
+        d = len(str(max(data)))
+
+        variants = {
+            "mergesort": lambda A, w: ms.mergesort_bottom_up(A, parallel=True, workers=w),
+            "radixsort": lambda A, w: rs.radixsort(A, d, parallel=True, workers=w),
+        }
+
+        for name, fn in variants.items():
+
+            base = None
+
+            for w in counts:
+                t = measure(lambda A: fn(A, w), data, args.repeat)
+                base = base or t
+                print_row(name, n, w, f"{t:.4f}s", f"{base / t:.2f}x")
+
+
+def bench_dijkstra(args):
+    """--sizes gibt hier die Anzahl der Kanten an."""
+
+    variants = {
+        "heapq (lazy)": dijkstra_heapq,
+        "MinHeap (lazy)": dijkstra_minheap,
+        "IndexedMinHeap": dijkstra_indexed,
+        "PairingHeap": dijkstra_pairing,
+        "RadixHeap": dijkstra_radix,
+    }
+
+    print_row("kanten", *variants)
+
+    for edges in args.sizes:
+        adj = make_graph(edges)
+        times = [measure(lambda _: fn(adj, 0), (), args.repeat) for fn in variants.values()]
+        print_row(edges, *(f"{t:.4f}s" for t in times))
+
+
+def bench_heapify(args):
+    """Aufbau plus vollstaendige Entnahme, klassisch (rekursiv) gegen fast=True."""
+
+    def drain(fast):
+        def run(A):
+            heap = MaxHeap(A, fast=fast)
+            while heap.heapSize:
+                heap.extractMax()
+        return run
+
+    print_row("n", "klassisch", "fast", "gewinn")
+
+    for n in args.sizes:
+        data = make_input("random", n)
+        slow = measure(drain(False), data, args.repeat)
+        fast = measure(drain(True), data, args.repeat)
+        print_row(n, f"{slow:.4f}s", f"{fast:.4f}s", f"{slow / fast:.2f}x")
+
+
+def bench_rbtree_memory(args):
+    """Bytes pro Knoten: Node mit __slots__ gegen das Struct-of-Arrays-Layout."""
+
+    def fill(tree, keys):
+        def build():
+            t = tree()
+            for k in keys:
+                t.insert(k)
+            return t
+        return build
+
+    print_row("n", "RBTree", "CompactRBTree")
+
+    for n in args.sizes:
+        keys = random.Random(0).sample(range(n * 10), n)
+        print_row(
+            n,
+            f"{bytes_per_item(fill(RBTree, keys), n):.1f} B",
+            f"{bytes_per_item(fill(CompactRBTree, keys), n):.1f} B",
+        )
+
+
+def bench_rbtree_build(args):
+    """Aufbau aus sortierten Paaren: Einfuege-Schleife gegen RBTree.from_sorted."""
+
+    def insert_loop(pairs):
+        tree = RBTree()
+        for key, value in pairs:
+            tree.insert(key, value)
+
+    variants = {
+        "insert-schleife": insert_loop,
+        "from_sorted": RBTree.from_sorted,
+    }
+
+    print_row("n", *variants)
+
+    for n in args.sizes:
+        pairs = [(k, None) for k in range(n)]
+        times = [measure(fn, pairs, args.repeat) for fn in variants.values()]
+        print_row(n, *(f"{t:.4f}s" for t in times))
+
+
+def bench_concurrent(args):
+    """
+    Durchsatz von ConcurrentTaskManager: gleich viele Producer- und
+    Worker-Threads, einmal mit get() pro Aufgabe, einmal mit drain(64).
+    Begrenzte Kapazitaet (maxsize=1024), damit auch put() blockiert.
+    """
+
+    def run(n, threads, batch):
+
+        manager = ConcurrentTaskManager(maxsize=1024)
+        per_thread = max(1, n // threads)
+        total = per_thread * threads
+        rng = random.Random(0)
+        priorities = [rng.randrange(1000) for _ in range(per_thread)]
+
+        def produce():
+            for p in priorities:
+                manager.put("aufgabe", p)
+
+        def consume(count):
+            done = 0
+            while done < count:
+                if batch:
+                    tasks = manager.drain(min(batch, count - done)) or [manager.get()]
+                else:
+                    tasks = [manager.get()]
+                for _ in tasks:
+                    manager.task_done()
+                done += len(tasks)
+
+        workers = [threading.Thread(target=produce) for _ in range(threads)]
+        workers += [threading.Thread(target=consume, args=(per_thread,)) for _ in range(threads)]
+
+        start = time.perf_counter()
+        for t in workers:
+            t.start()
+        manager.join()
+        for t in workers:
+            t.join()
+
+        return total / (time.perf_counter() - start)
+
+    print_row("n", "threads", "get()/s", "drain(64)/s")
+
+    for n in args.sizes:
+        for threads in (1, 2, 4, 8, 16, 32):
+            single = max(run(n, threads, 0) for _ in range(args.repeat))
+            batched = max(run(n, threads, 64) for _ in range(args.repeat))
+            print_row(n, threads, f"{single:,.0f}", f"{batched:,.0f}")
+
+
+def bench_async(args):
+    """
+    Scheduling-Overhead von AsyncTaskManager pro Aufgabe: put() plus
+    Ausfuehrung eines leeren Jobs im Worker-Pool. Zum Vergleich die reine
+    asyncio-Schleife (await auf dieselben Jobs ohne Warteschlange).
+    """
+
+    async def noop():
+        pass
+
+    async def direct(n):
+        for _ in range(n):
+            await noop()
+
+    async def scheduled(n, concurrency):
+        manager = AsyncTaskManager(maxsize=1024)
+
+        async def produce():
+            for i in range(n):
+                await manager.put("aufgabe", i % 1000, noop)
+
+        producer = asyncio.create_task(produce())
+        await asyncio.sleep(0)
+        while not producer.done() or manager.qsize():
+            await manager.run(concurrency)
+        await producer
+
+    def timed(make):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            asyncio.run(make())
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    print_row("n", "concurrency", "us/aufgabe", "aufgaben/s", "overhead us")
+
+    for n in args.sizes:
+        base = timed(lambda: direct(n)) / n
+        for concurrency in (1, 8, 64):
+            per_task = timed(lambda: scheduled(n, concurrency)) / n
+            print_row(n, concurrency, f"{per_task * 1e6:.2f}", f"{1 / per_task:,.0f}", f"{(per_task - base) * 1e6:.2f}")
+
+
+def bench_task_memory(args):
+    """Bytes pro wartender Aufgabe; Namen aus einem kleinen Vorrat wie in echten Queues."""
+
+    names = [f"aufgabe-{i}" for i in range(100)]
+
+    def fill(manager, n):
+        def build():
+            m = manager()
+            for i in range(n):
+                m.add_task(names[i % 100], i % 1000)
+            return m
+        return build
+
+    def fill_manual(n):
+        def build():
+            h = TaskMaxHeap()
+            for i in range(n):
+                h.insert(TaskManual(names[i % 100], i % 1000))
+            return h
+        return build
+
+    print_row("n", "TaskManager", "TaskMaxHeap", "Compact")
+
+    for n in args.sizes:
+        print_row(
+            n,
+            f"{bytes_per_item(fill(TaskManager, n), n):.1f} B",
+            f"{bytes_per_item(fill_manual(n), n):.1f} B",
+            f"{bytes_per_item(fill(CompactTaskManager, n), n):.1f} B",
+        )
+
+
+def bench_task_heap(args):
+    """n Einfuegungen plus n Entnahmen (2n Operationen) je Task-Warteschlange."""
+
+    def manual(heap_class):
+        def run(tasks):
+            heap = heap_class()
+            for task in tasks:
+                heap.insert(task)
+            while not heap.is_empty():
+                heap.extract_max()
+        return run
+
+    def fast_bulk(tasks):
+        heap = FastTaskMaxHeap(tasks)
+        while not heap.is_empty():
+            heap.extract_max()
+
+    def manager(tasks):
+        m = TaskManager()
+        for task in tasks:
+            m.add_task(task.name, task.priority)
+        while not m.is_empty():
+            m.get_next_task()
+
+    variants = {
+        "TaskMaxHeap": manual(TaskMaxHeap),
+        "Fast": manual(FastTaskMaxHeap),
+        "Fast+insert_many": fast_bulk,
+        "TaskManager": manager,
+    }
+
+    print_row("n", *variants)
+
+    for n in args.sizes:
+        rng = random.Random(0)
+        tasks = [TaskManual(f"aufgabe-{i % 100}", rng.randrange(1000)) for i in range(n)]
+        times = [measure(fn, tasks, args.repeat) for fn in variants.values()]
+        print_row(n, *(f"{t:.4f}s" for t in times))
+
+
+def bench_bucket(args):
+    """n add_task plus n get_next_task mit Prioritaeten 0..1000."""
+
+    def run(manager):
+        def fill_and_drain(priorities):
+            m = manager()
+            for p in priorities:
+                m.add_task("aufgabe", p)
+            while not m.is_empty():
+                m.get_next_task()
+        return fill_and_drain
+
+    variants = {
+        "TaskManager": run(TaskManager),
+        "Compact": run(CompactTaskManager),
+        "Bucket": run(BucketTaskManager),
+    }
+
+    print_row("n", *variants)
+
+    for n in args.sizes:
+        rng = random.Random(0)
+        priorities = [rng.randrange(1001) for _ in range(n)]
+        times = [measure(fn, priorities, args.repeat) for fn in variants.values()]
+        print_row(n, *(f"{t:.4f}s" for t in times))
+
+
+def bench_matrix(args):
+
+    matrix = build_matrix()
+    impls = args.impls or list(matrix)
+
+    unknown = sorted(set(impls) - set(matrix))
+    if unknown:
+        raise SystemExit(f"Unbekannte Implementierung(en): {', '.join(unknown)}")
+    results = []
+
+    print_row("impl", "verteilung", "n", "zeit", "vergleiche", "schreiben", "tausch", "peak")
+
+    for name in impls:
+        fn, comparison_based, max_n = matrix[name]
+        for distribution in args.distributions:
+            for n in args.sizes:
+                if max_n is not None and n > max_n:
+                    continue
+                cell = run_cell(name, fn, comparison_based, distribution, n, args.repeat)
+                results.append(cell)
+                if "error" in cell:
+                    print_row(name, distribution, n, cell["error"], "", "", "", "")
+                else:
+                    print_row(
+                        name, distribution, n, f"{cell['time']:.4f}s",
+                        *("-" if cell[m] is None else cell[m] for m in ("comparisons", "moves", "swaps")),
+                        f"{cell['peak_bytes'] / 1024:.0f} KiB",
+                    )
+
+    report = {
+        "python": platform.python_version(),
+        "sizes": args.sizes,
+        "distributions": args.distributions,
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        print()
+        print(f"{len(regressions)} Regression(en) ueber {args.threshold:.0%}")
+        for cell, metric, a, b in regressions:
+            print(f"  {cell['impl']} {cell['distribution']} n={cell['n']} {metric}: {a:g} -> {b:g}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+SUITES = {
+    "async": bench_async,
+    "bucket": bench_bucket,
+    "concurrent": bench_concurrent,
+    "dijkstra": bench_dijkstra,
+    "heapify": bench_heapify,
+    "matrix": bench_matrix,
+    "mergesort": bench_mergesort,
+    "parallel": bench_parallel,
+    "rbtree_build": bench_rbtree_build,
+    "rbtree_memory": bench_rbtree_memory,
+    "task_heap": bench_task_heap,
+    "task_memory": bench_task_memory,
+}
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("suite", choices=sorted(SUITES))
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--distributions", nargs="+", default=list(DISTRIBUTIONS), choices=DISTRIBUTIONS)
+    parser.add_argument("--impls", nargs="+", help="nur diese Implementierungen (matrix)")
+    parser.add_argument("--json", help="Ergebnis als JSON in diese Datei schreiben (matrix)")
+    parser.add_argument("--baseline", help="gespeichertes JSON zum Vergleich (matrix)")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    return SUITES[args.suite](args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,302 @@
+from collections import deque
+
+from TaskManager import REMOVED, Task, TaskManager
+
+
+class BucketTaskManager:
+    """
+    TaskManager für kleine, beschränkte ganzzahlige Prioritäten 0..max_priority.
+    Pro Priorität eine FIFO-deque, dazu eine Belegungs-Bitmaske als Python-int:
+    Bit p ist gesetzt, solange buckets[p] nicht leer ist. Die höchste belegte
+    Priorität liefert bit_length() - 1, ohne die leeren Buckets abzulaufen.
+
+    add_task in O(1), get_next_task in O(1) plus bit_length über
+    max_priority / 64 Maschinenworte. Gleiche Prioritäten bleiben FIFO wie
+    beim _counter-Tie-Breaker von TaskManager.
+
+    Die Schnittstelle entspricht TaskManager: add_task liefert eine task_id,
+    update_priority und cancel markieren den alten Eintrag als REMOVED
+    (Lazy Invalidation) und laufen in O(1).
+    """
+    COMPACT_MIN = 64
+
+    def __init__(self, max_priority: int = 1000):
+        self.max_priority = max_priority
+        self._buckets = [deque() for _ in range(max_priority + 1)]
+        self._occupied = 0
+        # [priority, task_id, task]; task wird bei update_priority/cancel auf REMOVED gesetzt
+        self._entries: dict[int, list] = {}
+        self._counter = 0
+        self._stale = 0
+
+    def add_task(self, name: str, priority: int) -> int:
+        self._check(priority)
+        task_id = self._counter
+        self._counter += 1
+        self._push(Task(name, priority), task_id)
+        return task_id
+
+    def _check(self, priority: int) -> None:
+        if type(priority) is not int or not 0 <= priority <= self.max_priority:
+            raise ValueError(f"Priorität muss ganzzahlig in 0..{self.max_priority} liegen: {priority!r}")
+
+    def _push(self, task: Task, task_id: int) -> None:
+        entry = [task.priority, task_id, task]
+        self._entries[task_id] = entry
+        bucket = self._buckets[task.priority]
+        if not bucket:
+            self._occupied |= 1 << task.priority
+        bucket.append(entry)
+
+    def get_next_task(self) -> Task:
+        entry = self._top()
+        p = entry[0]
+        bucket = self._buckets[p]
+        bucket.popleft()
+        if not bucket:
+            self._occupied ^= 1 << p
+        del self._entries[entry[1]]
+        return entry[2]
+
+    def peek_task(self) -> Task:
+        return self._top()[2]
+
+    def _top(self) -> list:
+        # Leichen vorne im höchsten Bucket wegräumen
+        while self._occupied:
+            p = self._occupied.bit_length() - 1
+            bucket = self._buckets[p]
+            if bucket[0][2] is not REMOVED:
+                return bucket[0]
+            bucket.popleft()
+            self._stale -= 1
+            if not bucket:
+                self._occupied ^= 1 << p
+        raise IndexError("index out of range")
+
+    def update_priority(self, task_id: int, priority: int) -> None:
+        """Neue Priorität; bei Gleichstand reiht sich die Aufgabe hinter die bereits wartenden ein."""
+        self._check(priority)
+        task = self._invalidate(task_id)
+        task.priority = priority
+        self._push(task, task_id)
+
+    def cancel(self, task_id: int) -> Task:
+        return self._invalidate(task_id)
+
+    def _invalidate(self, task_id: int) -> Task:
+        entry = self._entries.pop(task_id, None)
+        if entry is None:
+            raise KeyError(f"Unbekannte oder bereits entnommene Aufgabe: {task_id}")
+        task = entry[2]
+        entry[2] = REMOVED
+        self._stale += 1
+        if self._stale > self.COMPACT_MIN and self._stale > len(self._entries):
+            self._compact()
+        return task
+
+    def _compact(self) -> None:
+        self._occupied = 0
+        for p, bucket in enumerate(self._buckets):
+            if bucket:
+                live = deque(entry for entry in bucket if entry[2] is not REMOVED)
+                self._buckets[p] = live
+                if live:
+                    self._occupied |= 1 << p
+        self._stale = 0
+
+    def is_empty(self) -> bool:
+        return len(self._entries) == 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RadixTaskManager:
+    """
+    TaskManager auf einem RadixHeap für monoton fallende Prioritäten: eine
+    neue Aufgabe darf die zuletzt entnommene nicht überholen (etwa beim
+    Abarbeiten von Countdowns oder bei Dijkstra-artigen Abläufen). Der
+    Heap-Schlüssel ist max_priority - priority, damit die höchste Priorität
+    zuerst kommt; gleiche Prioritäten bleiben FIFO. Verstößt eine Priorität
+    gegen die Monotonie, wirft add_task bzw. update_priority ValueError.
+    cancel und update_priority wie bei BucketTaskManager per Lazy Invalidation.
+
+    Die Schranke für neue Aufgaben ist allein der Schlüssel der zuletzt von
+    get_next_task gelieferten Aufgabe; peek_task entnimmt nichts, und das
+    Wegräumen abgebrochener Einträge hebt sie nicht an.
+    """
+    def __init__(self, max_priority: int = 1000):
+        self.max_priority = max_priority
+        self._heap = RadixHeap(max(1, max_priority.bit_length()))
+        self._entries: dict[int, list] = {}
+        self._counter = 0
+        self._floor = 0
+
+    def add_task(self, name: str, priority: int) -> int:
+        task_id = self._counter
+        self._push(Task(name, priority), task_id)
+        self._counter += 1
+        return task_id
+
+    def _push(self, task: Task, task_id: int) -> None:
+        if type(task.priority) is not int or not 0 <= task.priority <= self.max_priority:
+            raise ValueError(f"Priorität muss ganzzahlig in 0..{self.max_priority} liegen: {task.priority!r}")
+        key = self.max_priority - task.priority
+        if key < self._floor:
+            raise ValueError(f"Priorität {task.priority} liegt über der zuletzt entnommenen")
+        entry = [task.priority, task_id, task]
+        self._heap.insert(key, entry)
+        self._entries[task_id] = entry
+
+    def get_next_task(self) -> Task:
+        while len(self._heap):
+            key, entry = self._heap.extractMin()
+            if entry[2] is not REMOVED:
+                self._floor = key
+                del self._entries[entry[1]]
+                return entry[2]
+        # Nur Leichen entnommen: frischer Heap, damit deren Schlüssel nicht als Schranke bleiben
+        self._heap = RadixHeap(max(1, self.max_priority.bit_length()))
+        raise IndexError("index out of range")
+
+    def peek_task(self) -> Task:
+        # Buckets aufsteigend absuchen, ohne zu entnehmen; innerhalb eines
+        # Buckets liefert min() bei Gleichstand den ältesten Eintrag
+        for bucket in self._heap._buckets:
+            live = [item for item in bucket if item[1][2] is not REMOVED]
+            if live:
+                return min(live, key=lambda item: item[0])[1][2]
+        raise IndexError("index out of range")
+
+    def update_priority(self, task_id: int, priority: int) -> None:
+        """Neue Priorität; bei Gleichstand reiht sich die Aufgabe hinter die bereits wartenden ein."""
+        entry = self._entries.get(task_id)
+        if entry is None:
+            raise KeyError(f"Unbekannte oder bereits entnommene Aufgabe: {task_id}")
+        task = entry[2]
+        old = task.priority
+        task.priority = priority
+        try:
+            self._push(task, task_id)
+        except ValueError:
+            task.priority = old
+            raise
+        entry[2] = REMOVED
+
+    def cancel(self, task_id: int) -> Task:
+        entry = self._entries.pop(task_id, None)
+        if entry is None:
+            raise KeyError(f"Unbekannte oder bereits entnommene Aufgabe: {task_id}")
+        task = entry[2]
+        entry[2] = REMOVED
+        return task
+
+    def is_empty(self) -> bool:
+        return len(self._entries) == 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def task_manager_for(max_priority: int | None = None, monotone: bool = False):
+    """
+    Wählt das Backend nach den Prioritäten: beschränkt auf 0..max_priority
+    gibt es BucketTaskManager, zusätzlich monoton fallend RadixTaskManager,
+    sonst TaskManager. Alle drei bieten add_task (mit task_id),
+    get_next_task, peek_task, update_priority, cancel, is_empty und len().
+    """
+    if max_priority is not None and 0 <= max_priority:
+        if monotone:
+            return RadixTaskManager(max_priority)
+        if max_priority <= 1 << 16:
+            return BucketTaskManager(max_priority)
+    return TaskManager()
+
+
+class RadixHeap:
+    """
+    Radix-Heap für monotone, nicht-negative Ganzzahl-Schlüssel: jeder neue
+    Schlüssel ist mindestens so groß wie der zuletzt entnommene (z. B.
+    Dijkstra oder Ereignissimulation). Bucket i hält die Schlüssel, deren
+    höchstes von last abweichendes Bit an Stelle i - 1 liegt. Ist Bucket 0
+    leer, wird der erste nicht-leere Bucket ab seinem Minimum neu verteilt;
+    jedes Element wandert dabei nur abwärts, amortisiert O(log C) pro
+    Operation. Gleiche Schlüssel kommen FIFO heraus.
+    """
+    def __init__(self, key_bits: int = 64):
+        self._buckets = [deque() for _ in range(key_bits + 1)]
+        self._last = 0
+        self._size = 0
+
+    def insert(self, key: int, value=None) -> None:
+        if key < self._last:
+            raise ValueError(f"Schlüssel {key} kleiner als zuletzt entnommener {self._last}")
+        self._buckets[(key ^ self._last).bit_length()].append((key, value))
+        self._size += 1
+
+    def extractMin(self):
+        if self._size == 0:
+            raise Exception("Heap is empty")
+        buckets = self._buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            items = buckets[i]
+            buckets[i] = deque()
+            last = self._last = min(key for key, _ in items)
+            for item in items:
+                buckets[(item[0] ^ last).bit_length()].append(item)
+        self._size -= 1
+        return buckets[0].popleft()
+
+    def getMinimum(self):
+        if self._size == 0:
+            raise Exception("Heap is empty")
+        buckets = self._buckets
+        if buckets[0]:
+            return buckets[0][0]
+        i = 1
+        while not buckets[i]:
+            i += 1
+        return min(buckets[i], key=lambda item: item[0])
+
+    def __len__(self):
+        return self._size
+
+
+if __name__ == "__main__":
+    manager = task_manager_for(max_priority=10)
+    manager.add_task("E-Mails beantworten", 2)
+    manager.add_task("Server neu starten", 10)
+    manager.add_task("Hauspost wegbringen", 7)
+    manager.add_task("Backup durchführen", 7)
+
+    while not manager.is_empty():
+        print("Bearbeite:", manager.get_next_task())
+
+    countdown = task_manager_for(max_priority=10, monotone=True)
+    for name, priority in [("Start", 10), ("Zwischenstand", 6)]:
+        countdown.add_task(name, priority)
+    print("Countdown:", countdown.get_next_task())
+    countdown.add_task("Halbzeit", 8)
+    while not countdown.is_empty():
+        print("Countdown:", countdown.get_next_task())
+
+    # Abbrechen und Nachsehen dürfen die Schranke nicht anheben
+    countdown = RadixTaskManager(10)
+    x = countdown.add_task("X", 9)
+    countdown.add_task("Y", 2)
+    countdown.cancel(x)
+    print("Nächste:", countdown.peek_task())
+    countdown.add_task("Z", 10)
+    print("Countdown:", countdown.get_next_task())
+
+    heap = RadixHeap()
+    for key in [5, 3, 8, 3]:
+        heap.insert(key, f"Ereignis {key}")
+    print(heap.extractMin())
+    heap.insert(4, "Ereignis 4")
+    while len(heap):
+        print(heap.extractMin())
@@ -0,0 +1,309 @@
+from array import array
+
+RED = 1
+BLACK = 0
+
+COLOR_NAMES = {RED: "RED", BLACK: "BLACK"}
+
+# Knoten-ID 0 ist der nil-Waechter
+NIL = 0
+
+
+class CompactRBTree:
+    """
+    Rot-Schwarz-Baum im Struct-of-Arrays-Layout. Ein Knoten ist nur eine
+    Ganzzahl-ID; left/right/parent liegen als parallele array('i')-Spalten,
+    die Farbe in einem bytearray, Schluessel und Werte in zwei Listen.
+    IDs geloeschter Knoten kommen auf eine Freiliste und werden wiederverwendet.
+
+    Die Methoden entsprechen RBTree, liefern statt Node-Objekten aber IDs
+    (key(x)/value(x) lesen die Spalten).
+    """
+
+    def __init__(self):
+
+        self.left = array("i", [NIL])
+        self.right = array("i", [NIL])
+        self.parent = array("i", [NIL])
+        self.color = bytearray([BLACK])
+        self.keys = [None]
+        self.values = [None]
+
+        self.free = []
+        self.root = NIL
+        self.size = 0
+
+    def new_node(self, key, value):
+
+        if self.free:
+            z = self.free.pop()
+            self.left[z] = self.right[z] = self.parent[z] = NIL
+            self.color[z] = RED
+            self.keys[z] = key
+            self.values[z] = value
+            return z
+
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.parent.append(NIL)
+        self.color.append(RED)
+        self.keys.append(key)
+        self.values.append(value)
+
+        return len(self.keys) - 1
+
+    def free_node(self, z):
+        self.keys[z] = None
+        self.values[z] = None
+        self.free.append(z)
+
+    def key(self, x):
+        return self.keys[x]
+
+    def value(self, x):
+        return self.values[x]
+
+    def search(self, key):
+        L, R, K = self.left, self.right, self.keys
+        x = self.root
+        while x != NIL and key != K[x]:
+            x = L[x] if key < K[x] else R[x]
+        return None if x == NIL else x
+
+    def minimum(self, node=None):
+        x = self.root if node is None else node
+        if x == NIL:
+            return None
+        while self.left[x] != NIL:
+            x = self.left[x]
+        return x
+
+    def maximum(self, node=None):
+        x = self.root if node is None else node
+        if x == NIL:
+            return None
+        while self.right[x] != NIL:
+            x = self.right[x]
+        return x
+
+    def successor(self, node):
+        R, P = self.right, self.parent
+        if R[node] != NIL:
+            return self.minimum(R[node])
+        y = P[node]
+        while y != NIL and node == R[y]:
+            node = y
+            y = P[y]
+        return None if y == NIL else y
+
+    def predecessor(self, node):
+        L, P = self.left, self.parent
+        if L[node] != NIL:
+            return self.maximum(L[node])
+        y = P[node]
+        while y != NIL and node == L[y]:
+            node = y
+            y = P[y]
+        return None if y == NIL else y
+
+    def left_rotate(self, x):
+        L, R, P = self.left, self.right, self.parent
+        y = R[x]
+        R[x] = L[y]
+        if L[y] != NIL:
+            P[L[y]] = x
+        P[y] = P[x]
+        if P[x] == NIL:
+            self.root = y
+        elif x == L[P[x]]:
+            L[P[x]] = y
+        else:
+            R[P[x]] = y
+        L[y] = x
+        P[x] = y
+
+    def right_rotate(self, y):
+        L, R, P = self.left, self.right, self.parent
+        x = L[y]
+        L[y] = R[x]
+        if R[x] != NIL:
+            P[R[x]] = y
+        P[x] = P[y]
+        if P[y] == NIL:
+            self.root = x
+        elif y == R[P[y]]:
+            R[P[y]] = x
+        else:
+            L[P[y]] = x
+        R[x] = y
+        P[y] = x
+
+    def insert(self, key, value=None):
+        L, R, K = self.left, self.right, self.keys
+        y = NIL
+        x = self.root
+        while x != NIL:
+            y = x
+            if key < K[x]:
+                x = L[x]
+            elif key > K[x]:
+                x = R[x]
+            else:
+                self.values[x] = value
+                return x
+        z = self.new_node(key, value)
+        self.parent[z] = y
+        if y == NIL:
+            self.root = z
+        elif key < K[y]:
+            L[y] = z
+        else:
+            R[y] = z
+        self.size += 1
+        self._insert_fixup(z)
+        return z
+
+    def _insert_fixup(self, z):
+        L, R, P, C = self.left, self.right, self.parent, self.color
+        while C[P[z]] == RED:
+            g = P[P[z]]
+            if P[z] == L[g]:
+                y = R[g]
+                if C[y] == RED:
+                    C[P[z]] = BLACK
+                    C[y] = BLACK
+                    C[g] = RED
+                    z = g
+                else:
+                    if z == R[P[z]]:
+                        z = P[z]
+                        self.left_rotate(z)
+                    C[P[z]] = BLACK
+                    C[P[P[z]]] = RED
+                    self.right_rotate(P[P[z]])
+            else:
+                y = L[g]
+                if C[y] == RED:
+                    C[P[z]] = BLACK
+                    C[y] = BLACK
+                    C[g] = RED
+                    z = g
+                else:
+                    if z == L[P[z]]:
+                        z = P[z]
+                        self.right_rotate(z)
+                    C[P[z]] = BLACK
+                    C[P[P[z]]] = RED
+                    self.left_rotate(P[P[z]])
+        C[self.root] = BLACK
+
+    def transplant(self, u, v):
+        L, R, P = self.left, self.right, self.parent
+        if P[u] == NIL:
+            self.root = v
+        elif u == L[P[u]]:
+            L[P[u]] = v
+        else:
+            R[P[u]] = v
+        P[v] = P[u]
+
+    def delete(self, key):
+        L, R, P, C = self.left, self.right, self.parent, self.color
+        z = self.search(key)
+        if z is None:
+            return False
+        y = z
+        y_original_color = C[y]
+        if L[z] == NIL:
+            x = R[z]
+            self.transplant(z, R[z])
+        elif R[z] == NIL:
+            x = L[z]
+            self.transplant(z, L[z])
+        else:
+            y = self.minimum(R[z])
+            y_original_color = C[y]
+            x = R[y]
+            if P[y] == z:
+                P[x] = y
+            else:
+                self.transplant(y, R[y])
+                R[y] = R[z]
+                P[R[y]] = y
+            self.transplant(z, y)
+            L[y] = L[z]
+            P[L[y]] = y
+            C[y] = C[z]
+        if y_original_color == BLACK:
+            self._delete_fixup(x)
+        self.free_node(z)
+        self.size -= 1
+        return True
+
+    def _delete_fixup(self, x):
+        L, R, P, C = self.left, self.right, self.parent, self.color
+        while x != self.root and C[x] == BLACK:
+            if x == L[P[x]]:
+                w = R[P[x]]
+                if C[w] == RED:
+                    C[w] = BLACK
+                    C[P[x]] = RED
+                    self.left_rotate(P[x])
+                    w = R[P[x]]
+                if C[L[w]] == BLACK and C[R[w]] == BLACK:
+                    C[w] = RED
+                    x = P[x]
+                else:
+                    if C[R[w]] == BLACK:
+                        C[L[w]] = BLACK
+                        C[w] = RED
+                        self.right_rotate(w)
+                        w = R[P[x]]
+                    C[w] = C[P[x]]
+                    C[P[x]] = BLACK
+                    C[R[w]] = BLACK
+                    self.left_rotate(P[x])
+                    x = self.root
+            else:
+                w = L[P[x]]
+                if C[w] == RED:
+                    C[w] = BLACK
+                    C[P[x]] = RED
+                    self.right_rotate(P[x])
+                    w = L[P[x]]
+                if C[R[w]] == BLACK and C[L[w]] == BLACK:
+                    C[w] = RED
+                    x = P[x]
+                else:
+                    if C[L[w]] == BLACK:
+                        C[R[w]] = BLACK
+                        C[w] = RED
+                        self.left_rotate(w)
+                        w = L[P[x]]
+                    C[w] = C[P[x]]
+                    C[P[x]] = BLACK
+                    C[L[w]] = BLACK
+                    self.right_rotate(P[x])
+                    x = self.root
+        C[x] = BLACK
+
+    def inorder(self):
+        result = []
+        x = self.minimum()
+        while x is not None:
+            result.append((self.keys[x], self.values[x], COLOR_NAMES[self.color[x]]))
+            x = self.successor(x)
+        return result
+
+    def __len__(self):
+        return self.size
+
+
+if __name__ == "__main__":
+    tree = CompactRBTree()
+    for key in [41, 38, 31, 12, 19, 8]:
+        tree.insert(key, f"Ereignis {key}")
+    print(tree.inorder())
+    print(tree.value(tree.search(19)))
+    tree.delete(12)
+    print(tree.inorder())
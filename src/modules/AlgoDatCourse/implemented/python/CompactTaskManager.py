@@ -0,0 +1,154 @@
+import sys
+from array import array
+
+from TaskManager import Task
+
+# task_id = Generation << SLOT_BITS | Slot, wie bei IndexedHeap
+SLOT_BITS = 32
+SLOT_MASK = (1 << SLOT_BITS) - 1
+
+
+class CompactTaskManager:
+    """
+    Spaltenbasierter TaskManager für sehr viele wartende Aufgaben. Statt
+    eines Heap-Eintrags plus Task-Objekt pro Aufgabe liegen Priorität und
+    Sequenznummer in array('q')-Spalten, die Namen interniert in einer
+    Liste; der Heap selbst ist ein array('q') aus Slot-Nummern.
+
+    pos[slot] führt die Heap-Position mit, so laufen update_priority und
+    cancel wie beim IndexedHeap in O(log n). Task-Objekte entstehen erst
+    bei der Entnahme. Slots entnommener Aufgaben kommen auf eine Freiliste;
+    die Generation pro Slot in der task_id sorgt dafür, dass eine veraltete
+    task_id wie bei TaskManager einen KeyError auslöst, statt die neue
+    Aufgabe im selben Slot zu treffen.
+    """
+    def __init__(self):
+        self._priority = array("q")
+        self._seq = array("q")   # Tie-breaker bei gleicher Priorität
+        self._pos = array("q")
+        self._gen = array("q")
+        self._names: list[str | None] = []
+        self._heap = array("q")
+        self._free = array("q")
+        self._counter = 0
+
+    def add_task(self, name: str, priority: int) -> int:
+        name = sys.intern(name)
+        if self._free:
+            slot = self._free.pop()
+            self._priority[slot] = priority
+            self._seq[slot] = self._counter
+            self._names[slot] = name
+        else:
+            slot = len(self._names)
+            self._priority.append(priority)
+            self._seq.append(self._counter)
+            self._pos.append(0)
+            self._gen.append(0)
+            self._names.append(name)
+        self._counter += 1
+        self._heap.append(slot)
+        self._sift_up(len(self._heap) - 1)
+        return self._gen[slot] << SLOT_BITS | slot
+
+    def get_next_task(self) -> Task:
+        if not self._heap:
+            raise IndexError("index out of range")
+        return self._remove_at(0)
+
+    def peek_task(self) -> Task:
+        if not self._heap:
+            raise IndexError("index out of range")
+        slot = self._heap[0]
+        return Task(self._names[slot], self._priority[slot])
+
+    def update_priority(self, task_id: int, priority: int) -> None:
+        """Neue Priorität; bei Gleichstand reiht sich die Aufgabe hinter die bereits wartenden ein."""
+        i = self._index(task_id)
+        slot = task_id & SLOT_MASK
+        self._priority[slot] = priority
+        self._seq[slot] = self._counter
+        self._counter += 1
+        self._sift_up(i)
+        self._sift_down(self._pos[slot])
+
+    def cancel(self, task_id: int) -> Task:
+        return self._remove_at(self._index(task_id))
+
+    def is_empty(self) -> bool:
+        return len(self._heap) == 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _index(self, task_id: int) -> int:
+        slot = task_id & SLOT_MASK
+        if (task_id < 0 or slot >= len(self._names) or self._names[slot] is None
+                or self._gen[slot] != task_id >> SLOT_BITS):
+            raise KeyError(f"Unbekannte oder bereits entnommene Aufgabe: {task_id}")
+        return self._pos[slot]
+
+    def _remove_at(self, i: int) -> Task:
+        heap = self._heap
+        slot = heap[i]
+        last = heap.pop()
+        if i < len(heap):
+            heap[i] = last
+            self._pos[last] = i
+            self._sift_up(i)
+            self._sift_down(self._pos[last])
+        task = Task(self._names[slot], self._priority[slot])
+        self._names[slot] = None
+        self._gen[slot] += 1
+        self._free.append(slot)
+        return task
+
+    def _sift_up(self, i: int) -> None:
+        heap, prio, seq, pos = self._heap, self._priority, self._seq, self._pos
+        slot = heap[i]
+        p, s = prio[slot], seq[slot]
+        while i > 0:
+            parent = (i - 1) >> 1
+            q = heap[parent]
+            if p < prio[q] or (p == prio[q] and s > seq[q]):
+                break
+            heap[i] = q
+            pos[q] = i
+            i = parent
+        heap[i] = slot
+        pos[slot] = i
+
+    def _sift_down(self, i: int) -> None:
+        heap, prio, seq, pos = self._heap, self._priority, self._seq, self._pos
+        n = len(heap)
+        slot = heap[i]
+        p, s = prio[slot], seq[slot]
+        c = 2 * i + 1
+        while c < n:
+            d = heap[c]
+            if c + 1 < n:
+                e = heap[c + 1]
+                if prio[e] > prio[d] or (prio[e] == prio[d] and seq[e] < seq[d]):
+                    c += 1
+                    d = e
+            if prio[d] < p or (prio[d] == p and seq[d] > s):
+                break
+            heap[i] = d
+            pos[d] = i
+            i = c
+            c = 2 * i + 1
+        heap[i] = slot
+        pos[slot] = i
+
+
+if __name__ == "__main__":
+    manager = CompactTaskManager()
+    manager.add_task("E-Mails beantworten", 2)
+    manager.add_task("Server neu starten", 10)
+    backup = manager.add_task("Backup durchführen", 5)
+    manager.add_task("Hauspost wegbringen", 7)
+
+    manager.update_priority(backup, 8)
+
+    while not manager.is_empty():
+        print("Bearbeite:", manager.get_next_task())
@@ -1,6 +1,52 @@
-﻿class Countingsort:
+﻿import Backend
 
-    def countingsort(self, A, k):
+
+# Ist der Wertebereich mehr als SPARSE_FACTOR-mal groesser als n, wird statt
+# eines Zaehlarrays nur ueber die tatsaechlich vorkommenden Schluessel gezaehlt
+SPARSE_FACTOR = 8
+
+
+class Countingsort:
+
+    def countingsort(self, A, k=None, key=None, backend="auto"):
+        """
+        Mit k (und ohne key) der klassische Countingsort fuer Werte 0..k.
+        Ohne k wird der Bereich min..max selbst bestimmt und um min
+        verschoben, damit gehen auch negative Zahlen. Mit key= werden
+        beliebige Datensaetze stabil nach der ganzzahligen key(x) sortiert.
+        """
+
+        if key is not None and backend == "numpy":
+            raise ValueError("key= wird nur vom Python-Backend unterstuetzt")
+
+        if key is None and Backend.resolve(backend, A) == "numpy":
+            return Backend.like(self.countingsort_numpy(A, k), A)
+
+        if k is not None and key is None:
+            return Backend.like(self.countingsort_classic(A, k), A)
+
+        keys = list(A) if key is None else [key(x) for x in A]
+        values = keys if key is None else A
+        n = len(keys)
+
+        if n == 0:
+            return Backend.like([], A) if key is None else []
+
+        if k is None:
+            lo = min(keys)
+            hi = max(keys)
+        else:
+            lo = 0
+            hi = k
+
+        if hi - lo + 1 > SPARSE_FACTOR * n:
+            B = self.countingsort_sparse(keys, values)
+        else:
+            B = self.countingsort_offset(keys, values, lo, hi)
+
+        return B if key is not None else Backend.like(B, A)
+
+    def countingsort_classic(self, A, k):
 
         n = len(A)
         C = [0] * (k + 1)
@@ -18,9 +64,94 @@
 
         return B
 
+    def countingsort_offset(self, keys, values, lo, hi):
+        """
+        Zaehlarray der Groesse hi - lo + 1, Schluessel x liegt bei C[x - lo].
+        values[j] wird an die Position von keys[j] geschrieben (stabil).
+        """
+
+        n = len(keys)
+        C = [0] * (hi - lo + 1)
+
+        for x in keys:
+            C[x - lo] += 1
+
+        # C[i] wird zur Startposition des Schluessels lo + i
+        total = 0
+        for i in range(len(C)):
+            C[i], total = total, total + C[i]
+
+        B = [None] * n
+
+        for j in range(n):
+            i = keys[j] - lo
+            B[C[i]] = values[j]
+            C[i] += 1
+
+        return B
+
+    def countingsort_sparse(self, keys, values):
+        """
+        Fuer duenn besetzte Bereiche: gezaehlt wird in einem dict, sortiert
+        werden nur die u verschiedenen Schluessel, also O(n + u log u).
+        """
+
+        counts = {}
+
+        for x in keys:
+            counts[x] = counts.get(x, 0) + 1
+
+        start = {}
+        total = 0
+        for x in sorted(counts):
+            start[x] = total
+            total += counts[x]
+
+        B = [None] * len(keys)
+
+        for j in range(len(keys)):
+            x = keys[j]
+            B[start[x]] = values[j]
+            start[x] += 1
+
+        return B
+
+    def countingsort_numpy(self, A, k=None):
+        """
+        Vektorisiert: np.bincount zaehlt, np.repeat schreibt jeden Wert
+        C[i]-mal hintereinander aus (die Praefixsummen stecken darin).
+        """
+
+        np = Backend.np
+        a = Backend.to_numpy(A)
+
+        if k is not None:
+            C = np.bincount(a, minlength=k + 1)
+            return np.repeat(np.arange(k + 1, dtype=a.dtype), C)
+
+        if a.size == 0:
+            return a.copy()
+
+        lo = int(a.min())
+        hi = int(a.max())
+
+        # uint64 oberhalb von intp laesst sich nicht verlustfrei fuer bincount verschieben
+        if hi - lo + 1 > SPARSE_FACTOR * a.size or hi > np.iinfo(np.intp).max:
+            keys, C = np.unique(a, return_counts=True)
+            return np.repeat(keys, C)
+
+        # Erst breiter machen, dann verschieben: in int8 usw. liefe a - lo sonst ueber
+        C = np.bincount(a.astype(np.intp) - lo, minlength=hi - lo + 1)
+
+        return np.repeat(np.arange(lo, hi + 1, dtype=a.dtype), C)
+
 
 if __name__ == "__main__":
 
     A = [2, 5, 3, 0, 2, 3, 0, 3]
     cs = Countingsort()
     print(cs.countingsort(A, 5))
+    print(cs.countingsort([3, -2, 7, -2, 0]))
+
+    events = [("login", 14), ("backup", 2), ("logout", 14), ("deploy", 9)]
+    print(cs.countingsort(events, key=lambda e: e[1]))
@@ -1,3 +1,6 @@
+from MaxHeap import MaxHeap
+
+
 class Heapsort:
 
     def heapsort(self, A):
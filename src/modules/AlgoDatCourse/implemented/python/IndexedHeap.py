@@ -0,0 +1,207 @@
+import operator
+
+# Handle = Generation << SLOT_BITS | Slot; nach remove wird der Slot wiederverwendet,
+# die Generation macht alte Handles dabei ungueltig
+SLOT_BITS = 32
+SLOT_MASK = (1 << SLOT_BITS) - 1
+
+
+class IndexedHeap:
+    """
+    Adressierbarer Heap: insert liefert ein Handle, das ueber alle
+    Vertauschungen hinweg gueltig bleibt. Eine Positionstabelle pos[slot]
+    wird beim Verschieben mitgefuehrt, dadurch laufen update, remove und
+    contains ohne Suche in O(log n) bzw. O(1). Slots entfernter Eintraege
+    werden wiederverwendet, der Speicher waechst also nur mit der
+    groessten gleichzeitigen Heapgroesse.
+
+    _before(a, b) legt fest, ob a naeher an der Wurzel stehen muss als b.
+    """
+
+    _before = None
+
+    def __init__(self):
+
+        self.heap = []    # Slots in Heap-Reihenfolge
+        self.keys = []    # keys[slot]
+        self.values = []  # values[slot]
+        self.pos = []     # pos[slot], -1 solange frei
+        self.gen = []     # gen[slot], erhoeht bei jedem remove
+        self.free = []    # freie Slots
+
+    """ HAUPTMETHODEN """
+
+    def insert(self, key, value=None):
+
+        if self.free:
+            slot = self.free.pop()
+            self.keys[slot] = key
+            self.values[slot] = value
+        else:
+            slot = len(self.keys)
+            self.keys.append(key)
+            self.values.append(value)
+            self.pos.append(-1)
+            self.gen.append(0)
+
+        self.heap.append(slot)
+        self.siftUp(len(self.heap) - 1)
+
+        return self.gen[slot] << SLOT_BITS | slot
+
+    def update(self, handle, key):
+
+        i = self._index(handle)
+        slot = handle & SLOT_MASK
+        old = self.keys[slot]
+        self.keys[slot] = key
+
+        if self._before(key, old):
+            self.siftUp(i)
+        else:
+            self.siftDown(i)
+
+    def remove(self, handle):
+        return self._removeAt(self._index(handle))
+
+    def _removeAt(self, i):
+
+        slot = self.heap[i]
+        last = self.heap.pop()
+
+        if last != slot:
+            self.heap[i] = last
+            self.pos[last] = i
+            self.siftUp(i)
+            self.siftDown(self.pos[last])
+
+        item = self.keys[slot], self.values[slot]
+
+        # Referenzen freigeben und alte Handles ungueltig machen
+        self.keys[slot] = self.values[slot] = None
+        self.pos[slot] = -1
+        self.gen[slot] += 1
+        self.free.append(slot)
+
+        return item
+
+    def contains(self, handle):
+        slot = handle & SLOT_MASK
+        return (0 <= handle and slot < len(self.pos) and self.pos[slot] >= 0
+                and self.gen[slot] == handle >> SLOT_BITS)
+
+    __contains__ = contains
+
+    def extractTop(self):
+
+        if not self.heap:
+            raise Exception("Heap is empty")
+
+        return self._removeAt(0)
+
+    def top(self):
+
+        if not self.heap:
+            raise Exception("Heap is empty")
+
+        slot = self.heap[0]
+        return self.keys[slot], self.values[slot]
+
+    """ VERSCHIEBEN """
+
+    def siftUp(self, i):
+
+        heap, keys, pos, before = self.heap, self.keys, self.pos, self._before
+
+        slot = heap[i]
+        key = keys[slot]
+
+        while i > 0:
+            p = (i - 1) >> 1
+            parent = heap[p]
+            if not before(key, keys[parent]):
+                break
+            heap[i] = parent
+            pos[parent] = i
+            i = p
+
+        heap[i] = slot
+        pos[slot] = i
+
+    def siftDown(self, i):
+
+        heap, keys, pos, before = self.heap, self.keys, self.pos, self._before
+        n = len(heap)
+
+        slot = heap[i]
+        key = keys[slot]
+
+        c = 2 * i + 1
+        while c < n:
+            if c + 1 < n and before(keys[heap[c + 1]], keys[heap[c]]):
+                c += 1
+            child = heap[c]
+            if not before(keys[child], key):
+                break
+            heap[i] = child
+            pos[child] = i
+            i = c
+            c = 2 * i + 1
+
+        heap[i] = slot
+        pos[slot] = i
+
+    """ GETTER METHODEN """
+
+    def key(self, handle):
+        self._index(handle)
+        return self.keys[handle & SLOT_MASK]
+
+    def value(self, handle):
+        self._index(handle)
+        return self.values[handle & SLOT_MASK]
+
+    def _index(self, handle):
+
+        if not self.contains(handle):
+            raise KeyError(f"Unbekanntes oder entferntes Handle: {handle}")
+
+        return self.pos[handle & SLOT_MASK]
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class IndexedMinHeap(IndexedHeap):
+
+    _before = operator.lt
+
+    def extractMin(self):
+        return self.extractTop()
+
+    def getMinimum(self):
+        return self.top()
+
+
+class IndexedMaxHeap(IndexedHeap):
+
+    _before = operator.gt
+
+    def extractMax(self):
+        return self.extractTop()
+
+    def getMaximum(self):
+        return self.top()
+
+
+if __name__ == "__main__":
+
+    heap = IndexedMinHeap()
+    handles = {name: heap.insert(key, name) for name, key in [("A", 7), ("B", 3), ("C", 9), ("D", 5)]}
+
+    heap.update(handles["C"], 1)
+    heap.remove(handles["B"])
+    print(handles["B"] in heap)
+
+    while len(heap):
+        print(heap.extractMin())
@@ -0,0 +1,330 @@
+"""
+Zuschaltbare Zaehl- und Trace-Haken fuer Sortierverfahren, Heaps und RBTree.
+
+Ohne aktive Session ist nichts gepatcht, die Implementierungen laufen
+unveraendert. Nur RBTree prueft in seinen Fixup-Schleifen RBTree.probe
+auf None.
+
+    counter = Counter()
+    trace = JsonTrace()
+    with Session(counter, trace) as session:
+        A = session.list([5, 2, 8, 1])
+        Heapsort().heapsort(A)
+    print(counter.counts)
+    trace.dump("heapsort.json")
+
+Ereignisse (op und Felder):
+
+    compare  i, j       zwei Elemente verglichen (Indizes beim letzten Lesen)
+    move     i, j       Element von Index i nach Index j geschrieben
+    swap     i, j       zwei gegenlaeufige moves direkt hintereinander
+    alloc    type       Node, PairingNode, Task oder TaskManual erzeugt
+    call     name, depth    rekursiver Aufruf von quicksort/mergesort
+    heapify  i, depth   eine Ebene von maxHeapify/minHeapify
+    rotate   dir, key   left_rotate/right_rotate im RBTree
+    fixup    phase      eine Runde der Insert- bzw. Delete-Fixup-Schleife
+
+compare/move/swap entstehen nur auf Listen aus session.list(); heapq und
+andere C-Funktionen greifen an __getitem__/__setitem__ vorbei.
+"""
+
+import functools
+import json
+import sys
+
+FIELDS = {
+    "compare": ("i", "j"),
+    "move": ("i", "j"),
+    "swap": ("i", "j"),
+    "alloc": ("type",),
+    "call": ("name", "depth"),
+    "heapify": ("i", "depth"),
+    "rotate": ("dir", "key"),
+    "fixup": ("phase",),
+}
+
+_active = None
+
+
+""" ELEMENTE UND LISTEN """
+
+
+def unwrap(x):
+    return x.v if isinstance(x, Probe) else x
+
+
+class Probe:
+    """Element-Huelle: merkt sich den Index, von dem sie zuletzt gelesen wurde, und meldet Vergleiche."""
+
+    __slots__ = ("v", "i")
+
+    def __init__(self, v, i=None):
+        self.v = v
+        self.i = i
+
+    def _compare(self, other):
+        if _active is not None:
+            _active.emit("compare", self.i, other.i if isinstance(other, Probe) else None)
+        return unwrap(other)
+
+    def __lt__(self, other):
+        return self.v < self._compare(other)
+
+    def __le__(self, other):
+        return self.v <= self._compare(other)
+
+    def __gt__(self, other):
+        return self.v > self._compare(other)
+
+    def __ge__(self, other):
+        return self.v >= self._compare(other)
+
+    def __eq__(self, other):
+        return self.v == self._compare(other)
+
+    def __ne__(self, other):
+        return self.v != self._compare(other)
+
+    def __neg__(self):
+        return Probe(-self.v)
+
+    def __hash__(self):
+        return hash(self.v)
+
+    def __repr__(self):
+        return repr(self.v)
+
+
+class InstrumentedList(list):
+    """Liste, deren Lese- und Schreibzugriffe per Index als move/swap-Ereignisse gemeldet werden."""
+
+    def __getitem__(self, i):
+        x = super().__getitem__(i)
+        if isinstance(x, Probe) and not isinstance(i, slice):
+            x.i = i if i >= 0 else i + len(self)
+        return x
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            value = list(value)
+            super().__setitem__(i, value)
+            if _active is not None:
+                for j, x in zip(range(*i.indices(len(self))), value):
+                    _active.moved(x, j)
+            return
+        if i < 0:
+            i += len(self)
+        super().__setitem__(i, value)
+        if _active is not None:
+            _active.moved(value, i)
+
+
+""" SESSION """
+
+
+class Session:
+    """
+    Aktiviert die Haken fuer die Dauer eines with-Blocks und verteilt jedes
+    Ereignis an alle Collectors (Objekte mit event(kind, args)).
+    """
+
+    def __init__(self, *collectors):
+        self.collectors = collectors
+        self._patches = []
+        self._last_move = None
+        self._recursion_limit = None
+
+    def list(self, data, wrap=True):
+        """Instrumentierte Kopie von data; wrap=False fuer Verfahren, die echte ints brauchen (Counting-/Radixsort)."""
+        return InstrumentedList(Probe(x, i) for i, x in enumerate(data)) if wrap else InstrumentedList(data)
+
+    def emit(self, kind, *args):
+        for collector in self.collectors:
+            collector.event(kind, args)
+
+    def moved(self, value, j):
+        i = value.i if isinstance(value, Probe) else None
+        self.emit("move", i, j)
+        if self._last_move == (j, i):
+            self.emit("swap", j, i)
+            self._last_move = None
+        else:
+            self._last_move = (i, j)
+        if isinstance(value, Probe):
+            value.i = j
+
+    def __enter__(self):
+
+        global _active
+
+        if _active is not None:
+            raise RuntimeError("Es ist bereits eine Instrumentation-Session aktiv")
+
+        from Mergesort import Mergesort
+        from MaxHeap import MaxHeap
+        from MinHeap import MinHeap
+        from PairingHeap import PairingNode
+        from Quicksort import Quicksort
+        from RBTree import Node, RBTree
+        from TaskManager import Task
+        from TaskMaxHeap import TaskManual
+
+        for owner, name in ((Quicksort, "quicksort"), (Mergesort, "mergesort")):
+            self._wrap(owner, name, self._recursive(name, "call"))
+        for owner, name in ((MaxHeap, "maxHeapify"), (MinHeap, "minHeapify")):
+            self._wrap(owner, name, self._recursive(name, "heapify"))
+        for name in ("left_rotate", "right_rotate"):
+            self._wrap(RBTree, name, self._rotation(name.split("_")[0]))
+        for cls in (Node, PairingNode, Task, TaskManual):
+            self._wrap(cls, "__init__", self._allocation(cls.__name__))
+
+        self._patches.append((RBTree, "probe", RBTree.probe))
+        RBTree.probe = staticmethod(self.emit)
+
+        # Jede Rekursionsebene kostet mit Wrapper zwei Frames; ohne hoeheres Limit
+        # liefe z. B. klassischer Quicksort auf sortierter Eingabe nur hier in den RecursionError
+        self._recursion_limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(2 * self._recursion_limit + 100)
+
+        _active = self
+        return self
+
+    def __exit__(self, *exc):
+
+        global _active
+
+        for owner, name, original in reversed(self._patches):
+            setattr(owner, name, original)
+        self._patches.clear()
+        sys.setrecursionlimit(self._recursion_limit)
+        _active = None
+
+    def _wrap(self, owner, name, make_wrapper):
+        original = owner.__dict__[name]
+        setattr(owner, name, functools.wraps(original)(make_wrapper(original)))
+        self._patches.append((owner, name, original))
+
+    def _recursive(self, name, kind):
+        def make(original):
+            depth = 0
+
+            def wrapper(obj, *args, **kwargs):
+                nonlocal depth
+                depth += 1
+                self.emit(kind, name if kind == "call" else args[0], depth)
+                try:
+                    return original(obj, *args, **kwargs)
+                finally:
+                    depth -= 1
+
+            return wrapper
+        return make
+
+    def _rotation(self, direction):
+        def make(original):
+            def wrapper(tree, x):
+                self.emit("rotate", direction, unwrap(x.key))
+                return original(tree, x)
+            return wrapper
+        return make
+
+    def _allocation(self, type_name):
+        def make(original):
+            def wrapper(obj, *args, **kwargs):
+                self.emit("alloc", type_name)
+                return original(obj, *args, **kwargs)
+            return wrapper
+        return make
+
+
+""" COLLECTORS """
+
+
+class Counter:
+    """Zaehlt Ereignisse pro Art; max_depth ist die tiefste gemeldete Rekursions- bzw. Heapify-Tiefe."""
+
+    def __init__(self):
+        self.counts = {}
+        self.max_depth = 0
+
+    def event(self, kind, args):
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        if kind in ("call", "heapify") and args[1] > self.max_depth:
+            self.max_depth = args[1]
+
+    def __getitem__(self, kind):
+        return self.counts.get(kind, 0)
+
+
+class Histogram:
+    """Haeufigkeit der Werte eines Feldes fuer eine Ereignisart, z. B. Histogram("heapify", "depth")."""
+
+    def __init__(self, kind="call", field="depth"):
+        self.kind = kind
+        self.index = FIELDS[kind].index(field)
+        self.bins = {}
+
+    def event(self, kind, args):
+        if kind == self.kind:
+            value = args[self.index]
+            self.bins[value] = self.bins.get(value, 0) + 1
+
+    def rows(self):
+        return sorted(self.bins.items())
+
+
+class JsonTrace:
+    """
+    Ereignisfolge als JSON zum Nachspielen im DatastructureLab (FILE > Laden
+    erkennt "type": "Trace"). initial ist optional der Ausgangszustand im
+    Format der Lab-Exporte, etwa {"type": "MaxHeap", "nodes": [{"k": 5, "v": None}, ...]};
+    fehlt er, laeuft der Trace auf der gerade geoeffneten Struktur. Mit limit
+    werden nur die ersten limit Ereignisse aufgezeichnet.
+    """
+
+    def __init__(self, initial=None, limit=None):
+        self.initial = initial
+        self.limit = limit
+        self.events = []
+        self.truncated = False
+
+    def event(self, kind, args):
+        if self.limit is not None and len(self.events) >= self.limit:
+            self.truncated = True
+            return
+        self.events.append({"op": kind, **dict(zip(FIELDS[kind], args))})
+
+    def to_json(self):
+        return {
+            "type": "Trace",
+            "version": 1,
+            "initial": self.initial,
+            "truncated": self.truncated,
+            "events": self.events,
+        }
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f, indent=1)
+
+
+if __name__ == "__main__":
+
+    from Heapsort import Heapsort
+    from RBTree import RBTree
+
+    counter = Counter()
+    levels = Histogram("heapify", "depth")
+    trace = JsonTrace(limit=12)
+
+    with Session(counter, levels, trace) as session:
+        A = session.list([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5])
+        Heapsort().heapsort(A)
+        tree = RBTree()
+        for key in [41, 38, 31, 12, 19, 8]:
+            tree.insert(key)
+
+    print([unwrap(x) for x in A])
+    print(counter.counts, "max. Tiefe:", counter.max_depth)
+    print("Heapify-Ebenen:", levels.rows())
+    print(trace.events[:4])
@@ -1,8 +1,28 @@
+import heapq
+from itertools import islice
+
+import Snapshot
+
+
+class _Descending:
+    """Eintrag fuer den Hilfsheap von iterSorted: heapq ist ein MinHeap, daher umgekehrter Vergleich."""
+
+    __slots__ = ("key", "i")
+
+    def __init__(self, key, i):
+        self.key = key
+        self.i = i
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+
 class MaxHeap:
 
-    def __init__(self, A):
+    def __init__(self, A, fast=False):
         self.A = A
         self.heapSize = len(A)
+        self.fast = fast
         self.buildMaxHeap()
 
     """ HAUPTMETHODEN """
@@ -11,8 +31,10 @@ class MaxHeap:
 
         self.heapSize = len(self.A)
 
+        heapify = self.siftDown if self.fast else self.maxHeapify
+
         for i in range(self.heapSize // 2 - 1, -1, -1):
-            self.maxHeapify(i)
+            heapify(i)
 
     def maxHeapify(self, i):
 
@@ -45,6 +67,9 @@ class MaxHeap:
 
     def extractMax(self):
 
+        if self.fast:
+            return self.extractMaxFloyd()
+
         if self.heapSize == 0:
             raise Exception("Heap is empty")
 
@@ -70,13 +95,141 @@ class MaxHeap:
 
         self.A[i] = key
 
-        while i > 0 and self.A[self.parent(i)] < self.A[i]:
+        self.siftUp(i)
 
-            temp = self.A[i]
-            self.A[i] = self.A[self.parent(i)]
-            self.A[self.parent(i)] = temp
+    """ MASSENOPERATIONEN """
+
+    def insert_many(self, iterable):
+        """
+        Fuegt alle Schluessel auf einmal ein. Ist der Stapel gross im
+        Verhaeltnis zum Heap, ist ein Neuaufbau mit buildMaxHeap (O(n + m))
+        billiger als m einzelne Aufstiege (O(m log(n + m))).
+        """
+
+        keys = list(iterable)
+        m = len(keys)
+
+        if m == 0:
+            return
+
+        n = self.heapSize
+        self.A.extend(keys)
+
+        if m * (n + m).bit_length() > 2 * (n + m):
+            self.buildMaxHeap()
+        else:
+            self.heapSize = len(self.A)
+            for i in range(n, self.heapSize):
+                self.siftUp(i)
+
+    def extract_many(self, k):
+
+        k = min(k, self.heapSize)
+
+        return [self.extractMax() for _ in range(k)]
+
+    def merge(self, other):
+        """Verschmilzt other in diesen Heap (other bleibt unveraendert)."""
+
+        self.insert_many(other.A[: other.heapSize])
+
+    """ PERSISTENZ """
+
+    def save(self, path):
+        """Schreibt das rohe Array A samt heapSize als binaeren Snapshot."""
+        Snapshot.save_heap(self, path, Snapshot.KIND_MAXHEAP)
+
+    @classmethod
+    def load(cls, path):
+        """Laedt A und heapSize per mmap; die Heap-Eigenschaft gilt schon, daher ohne Neuaufbau."""
+        return Snapshot.load_heap(path, cls, Snapshot.KIND_MAXHEAP)
+
+    """ SCHNELLE VARIANTEN """
 
-            i = self.parent(i)
+    def siftUp(self, i):
+        """
+        Schiebt A[i] nach oben. Das Element bleibt in einer lokalen Variable,
+        die Eltern ruecken in das Loch nach, statt paarweise zu tauschen.
+        """
+
+        A = self.A
+        item = A[i]
+
+        while i > 0:
+            p = (i - 1) >> 1
+            parent = A[p]
+            if not parent < item:
+                break
+            A[i] = parent
+            i = p
+
+        A[i] = item
+
+    def siftDown(self, i):
+        """
+        Iterative Variante von maxHeapify nach dem Vorbild von heapq._siftup:
+        Indexrechnung inline, Kinder ruecken in das Loch nach.
+        """
+
+        A = self.A
+        n = self.heapSize
+        item = A[i]
+
+        c = 2 * i + 1
+        while c < n:
+            r = c + 1
+            if r < n and A[c] < A[r]:
+                c = r
+            child = A[c]
+            if not item < child:
+                break
+            A[i] = child
+            i = c
+            c = 2 * i + 1
+
+        A[i] = item
+
+    def extractMaxFloyd(self):
+        """
+        Entnahme nach Floyd: das Loch an der Wurzel wandert ohne Vergleich
+        mit dem letzten Element bis zu einem Blatt (ein Vergleich pro Ebene
+        statt zwei), dort wird das letzte Element eingesetzt und steigt auf.
+        """
+
+        if self.heapSize == 0:
+            raise Exception("Heap is empty")
+
+        A = self.A
+        n = self.heapSize - 1
+
+        top = A[0]
+        last = A[n]
+
+        self.heapSize = n
+        A.pop()
+
+        if n == 0:
+            return top
+
+        i = 0
+        c = 1
+        while c < n:
+            if c + 1 < n and A[c] < A[c + 1]:
+                c += 1
+            A[i] = A[c]
+            i = c
+            c = 2 * i + 1
+
+        while i > 0:
+            p = (i - 1) >> 1
+            if not A[p] < last:
+                break
+            A[i] = A[p]
+            i = p
+
+        A[i] = last
+
+        return top
 
     """ HILFSFUNKTIONEN IM BAUM """
 
@@ -96,18 +249,40 @@ class MaxHeap:
 
     def getSortedArray(self):
 
-        backupA = self.A.copy()
-        backupHeapSize = self.heapSize
+        sortedArray = list(self.iterSorted())
+        sortedArray.reverse()
 
-        sortedArray = [0] * self.heapSize
+        return sortedArray
 
-        for i in range(self.heapSize - 1, -1, -1):
-            sortedArray[i] = self.extractMax()
+    def iterSorted(self):
+        """
+        Liefert die Elemente absteigend, ohne den Heap zu kopieren oder zu
+        veraendern. Ein Hilfsheap (heapq) haelt die Kandidaten-Indizes;
+        nach jeder Ausgabe kommen die beiden Kinder des ausgegebenen Knotens
+        hinzu. Die ersten k Elemente kosten O(k log k).
+        """
 
-        self.A = backupA
-        self.heapSize = backupHeapSize
+        A = self.A
+        n = self.heapSize
 
-        return sortedArray
+        if n == 0:
+            return
+
+        frontier = [_Descending(A[0], 0)]
+
+        while frontier:
+
+            top = heapq.heappop(frontier)
+            yield top.key
+
+            c = 2 * top.i + 1
+            if c < n:
+                heapq.heappush(frontier, _Descending(A[c], c))
+            if c + 1 < n:
+                heapq.heappush(frontier, _Descending(A[c + 1], c + 1))
+
+    def nlargest(self, k):
+        return list(islice(self.iterSorted(), k))
 
     def getMinimum(self):
 
@@ -136,5 +311,6 @@ if __name__ == "__main__":
     maxHeap = MaxHeap([5, 2, 1, 3, 7, 8])
     print(maxHeap.getHeap())
     print(maxHeap.getSortedArray())
+    print(maxHeap.nlargest(3))
     print(maxHeap.getMinimum())
     print(maxHeap.getMaximum())
\ No newline at end of file
@@ -1,4 +1,13 @@
-﻿class Mergesort:
+﻿from bisect import bisect_left, bisect_right
+
+# Kuerzere natuerliche Runs werden per Insertionsort auf diese Laenge gebracht
+MIN_RUN = 32
+
+# Nach so vielen Siegen in Folge wechselt merge in den Galopp-Modus
+MIN_GALLOP = 7
+
+
+class Mergesort:
 
     def mergesort(self, A, p, r):
 
@@ -29,6 +38,191 @@
                 A[k] = R[j]
                 j += 1
 
+    """ BOTTOM-UP MERGESORT """
+
+    def mergesort_bottom_up(self, A, key=None, reverse=False, parallel=False, workers=None):
+        """
+        Stabiler Bottom-up-Mergesort nach Timsort-Art: vorhandene auf- und
+        absteigende Runs werden erkannt und paarweise gemischt. Es wird genau
+        ein Hilfspuffer angelegt, zwischen dem und A hin- und hergemischt
+        wird. Ohne Sentinels, daher auch fuer Strings, Tupel usw.
+
+        Mit parallel=True werden Ganzzahlen auf `workers` Prozesse verteilt
+        (siehe ParallelSort.parallel_mergesort).
+        """
+
+        if parallel:
+            if key is not None or reverse:
+                raise ValueError("parallel=True unterstuetzt weder key noch reverse")
+            from ParallelSort import parallel_mergesort
+            return parallel_mergesort(A, workers)
+
+        n = len(A)
+
+        if n < 2:
+            return A
+
+        # Stabil absteigend = umdrehen, stabil aufsteigend sortieren, umdrehen
+        if reverse:
+            A.reverse()
+
+        K = A if key is None else [key(x) for x in A]
+        V = None if key is None else A
+
+        bounds = self.find_runs(K, V)
+
+        src = (K, V)
+        dst = ([None] * n, None if V is None else [None] * n)
+
+        while len(bounds) > 2:
+
+            merged = [0]
+
+            for b in range(0, len(bounds) - 2, 2):
+                self.merge_runs(src, dst, bounds[b], bounds[b + 1], bounds[b + 2])
+                merged.append(bounds[b + 2])
+
+            if len(bounds) % 2 == 0:
+                # ungerade Anzahl Runs: der letzte wird nur umkopiert
+                lo = bounds[-2]
+                dst[0][lo:] = src[0][lo:]
+                if V is not None:
+                    dst[1][lo:] = src[1][lo:]
+                merged.append(n)
+
+            bounds = merged
+            src, dst = dst, src
+
+        if V is None:
+            if src[0] is not A:
+                A[:] = src[0]
+        elif src[1] is not A:
+            A[:] = src[1]
+
+        if reverse:
+            A.reverse()
+
+        return A
+
+    def find_runs(self, K, V):
+        """
+        Zerlegt K in natuerliche Runs und liefert deren Grenzen.
+        Streng absteigende Runs werden umgedreht (das bleibt stabil),
+        zu kurze Runs per binaerem Insertionsort auf MIN_RUN verlaengert.
+        """
+
+        n = len(K)
+        bounds = [0]
+        lo = 0
+
+        while lo < n:
+
+            hi = lo + 1
+
+            if hi < n and K[hi] < K[lo]:
+                while hi < n and K[hi] < K[hi - 1]:
+                    hi += 1
+                K[lo:hi] = K[lo:hi][::-1]
+                if V is not None:
+                    V[lo:hi] = V[lo:hi][::-1]
+            else:
+                while hi < n and not K[hi] < K[hi - 1]:
+                    hi += 1
+
+            if hi - lo < MIN_RUN and hi < n:
+                end = min(n, lo + MIN_RUN)
+                self.binary_insertionsort(K, V, lo, hi, end)
+                hi = end
+
+            bounds.append(hi)
+            lo = hi
+
+        return bounds
+
+    def binary_insertionsort(self, K, V, lo, start, hi):
+
+        for j in range(start, hi):
+
+            k = K[j]
+            pos = bisect_right(K, k, lo, j)
+
+            K[pos + 1 : j + 1] = K[pos:j]
+            K[pos] = k
+
+            if V is not None:
+                v = V[j]
+                V[pos + 1 : j + 1] = V[pos:j]
+                V[pos] = v
+
+    def merge_runs(self, src, dst, lo, mid, hi):
+        """
+        Mischt die Runs src[lo:mid] und src[mid:hi] nach dst[lo:hi].
+        Gewinnt eine Seite MIN_GALLOP-mal in Folge, wird per binaerer Suche
+        der ganze passende Block auf einmal kopiert.
+        """
+
+        sk, sv = src
+        dk, dv = dst
+
+        # Runs liegen bereits in Reihenfolge
+        if not sk[mid] < sk[mid - 1]:
+            dk[lo:hi] = sk[lo:hi]
+            if sv is not None:
+                dv[lo:hi] = sv[lo:hi]
+            return
+
+        i = lo
+        j = mid
+        k = lo
+        winsLeft = 0
+        winsRight = 0
+
+        while i < mid and j < hi:
+
+            if sk[j] < sk[i]:
+                dk[k] = sk[j]
+                if sv is not None:
+                    dv[k] = sv[j]
+                j += 1
+                k += 1
+                winsRight += 1
+                winsLeft = 0
+
+                if winsRight >= MIN_GALLOP and i < mid:
+                    e = bisect_left(sk, sk[i], j, hi)
+                    dk[k : k + e - j] = sk[j:e]
+                    if sv is not None:
+                        dv[k : k + e - j] = sv[j:e]
+                    k += e - j
+                    j = e
+                    winsRight = 0
+            else:
+                dk[k] = sk[i]
+                if sv is not None:
+                    dv[k] = sv[i]
+                i += 1
+                k += 1
+                winsLeft += 1
+                winsRight = 0
+
+                if winsLeft >= MIN_GALLOP and j < hi:
+                    e = bisect_right(sk, sk[j], i, mid)
+                    dk[k : k + e - i] = sk[i:e]
+                    if sv is not None:
+                        dv[k : k + e - i] = sv[i:e]
+                    k += e - i
+                    i = e
+                    winsLeft = 0
+
+        if i < mid:
+            dk[k:hi] = sk[i:mid]
+            if sv is not None:
+                dv[k:hi] = sv[i:mid]
+        else:
+            dk[k:hi] = sk[j:hi]
+            if sv is not None:
+                dv[k:hi] = sv[j:hi]
+
 
 if __name__ == "__main__":
 
@@ -36,3 +230,6 @@ if __name__ == "__main__":
     ms = Mergesort()
     ms.mergesort(A, 0, len(A) - 1)
     print(A)
+
+    W = ["Birne", "apfel", "Apfel", "kiwi", "Banane"]
+    print(ms.mergesort_bottom_up(W, key=str.lower, reverse=True))
@@ -1,9 +1,16 @@
+import heapq
+from itertools import islice
+
+import Snapshot
+
+
 class MinHeap:
 
-    def __init__(self, A):
+    def __init__(self, A, fast=False):
 
         self.A = A
         self.heapSize = len(A)
+        self.fast = fast
 
         self.buildMinHeap()
 
@@ -13,8 +20,10 @@ class MinHeap:
 
         self.heapSize = len(self.A)
 
+        heapify = self.siftDown if self.fast else self.minHeapify
+
         for i in range(self.heapSize // 2 - 1, -1, -1):
-            self.minHeapify(i)
+            heapify(i)
 
     def minHeapify(self, i):
 
@@ -47,6 +56,9 @@ class MinHeap:
 
     def extractMin(self):
 
+        if self.fast:
+            return self.extractMinFloyd()
+
         if self.heapSize == 0:
             raise Exception("Heap is empty")
 
@@ -72,13 +84,141 @@ class MinHeap:
 
         self.A[i] = key
 
-        while i > 0 and self.A[self.parent(i)] > self.A[i]:
+        self.siftUp(i)
 
-            temp = self.A[i]
-            self.A[i] = self.A[self.parent(i)]
-            self.A[self.parent(i)] = temp
+    """ MASSENOPERATIONEN """
+
+    def insert_many(self, iterable):
+        """
+        Fuegt alle Schluessel auf einmal ein. Ist der Stapel gross im
+        Verhaeltnis zum Heap, ist ein Neuaufbau mit buildMinHeap (O(n + m))
+        billiger als m einzelne Aufstiege (O(m log(n + m))).
+        """
+
+        keys = list(iterable)
+        m = len(keys)
+
+        if m == 0:
+            return
+
+        n = self.heapSize
+        self.A.extend(keys)
+
+        if m * (n + m).bit_length() > 2 * (n + m):
+            self.buildMinHeap()
+        else:
+            self.heapSize = len(self.A)
+            for i in range(n, self.heapSize):
+                self.siftUp(i)
+
+    def extract_many(self, k):
+
+        k = min(k, self.heapSize)
+
+        return [self.extractMin() for _ in range(k)]
+
+    def merge(self, other):
+        """Verschmilzt other in diesen Heap (other bleibt unveraendert)."""
+
+        self.insert_many(other.A[: other.heapSize])
+
+    """ PERSISTENZ """
+
+    def save(self, path):
+        """Schreibt das rohe Array A samt heapSize als binaeren Snapshot."""
+        Snapshot.save_heap(self, path, Snapshot.KIND_MINHEAP)
+
+    @classmethod
+    def load(cls, path):
+        """Laedt A und heapSize per mmap; die Heap-Eigenschaft gilt schon, daher ohne Neuaufbau."""
+        return Snapshot.load_heap(path, cls, Snapshot.KIND_MINHEAP)
+
+    """ SCHNELLE VARIANTEN """
+
+    def siftUp(self, i):
+        """
+        Schiebt A[i] nach oben. Das Element bleibt in einer lokalen Variable,
+        die Eltern ruecken in das Loch nach, statt paarweise zu tauschen.
+        """
 
-            i = self.parent(i)
+        A = self.A
+        item = A[i]
+
+        while i > 0:
+            p = (i - 1) >> 1
+            parent = A[p]
+            if not item < parent:
+                break
+            A[i] = parent
+            i = p
+
+        A[i] = item
+
+    def siftDown(self, i):
+        """
+        Iterative Variante von minHeapify nach dem Vorbild von heapq._siftup:
+        Indexrechnung inline, Kinder ruecken in das Loch nach.
+        """
+
+        A = self.A
+        n = self.heapSize
+        item = A[i]
+
+        c = 2 * i + 1
+        while c < n:
+            r = c + 1
+            if r < n and A[r] < A[c]:
+                c = r
+            child = A[c]
+            if not child < item:
+                break
+            A[i] = child
+            i = c
+            c = 2 * i + 1
+
+        A[i] = item
+
+    def extractMinFloyd(self):
+        """
+        Entnahme nach Floyd: das Loch an der Wurzel wandert ohne Vergleich
+        mit dem letzten Element bis zu einem Blatt (ein Vergleich pro Ebene
+        statt zwei), dort wird das letzte Element eingesetzt und steigt auf.
+        """
+
+        if self.heapSize == 0:
+            raise Exception("Heap is empty")
+
+        A = self.A
+        n = self.heapSize - 1
+
+        top = A[0]
+        last = A[n]
+
+        self.heapSize = n
+        A.pop()
+
+        if n == 0:
+            return top
+
+        i = 0
+        c = 1
+        while c < n:
+            if c + 1 < n and A[c + 1] < A[c]:
+                c += 1
+            A[i] = A[c]
+            i = c
+            c = 2 * i + 1
+
+        while i > 0:
+            p = (i - 1) >> 1
+            if not last < A[p]:
+                break
+            A[i] = A[p]
+            i = p
+
+        A[i] = last
+
+        return top
 
     """ HILFSFUNKTIONEN IM BAUM """
 
@@ -97,19 +237,37 @@ class MinHeap:
         return self.A
 
     def getSortedArray(self):
+        return list(self.iterSorted())
+
+    def iterSorted(self):
+        """
+        Liefert die Elemente aufsteigend, ohne den Heap zu kopieren oder zu
+        veraendern. Ein Hilfsheap (heapq) haelt die Kandidaten als
+        (Schluessel, Index); nach jeder Ausgabe kommen die beiden Kinder des
+        ausgegebenen Knotens hinzu. Die ersten k Elemente kosten O(k log k).
+        """
+
+        A = self.A
+        n = self.heapSize
+
+        if n == 0:
+            return
 
-        backupA = self.A.copy()
-        backupHeapSize = self.heapSize
+        frontier = [(A[0], 0)]
 
-        sortedArray = [0] * self.heapSize
+        while frontier:
 
-        for i in range(len(sortedArray)):
-            sortedArray[i] = self.extractMin()
+            key, i = heapq.heappop(frontier)
+            yield key
 
-        self.A = backupA
-        self.heapSize = backupHeapSize
+            c = 2 * i + 1
+            if c < n:
+                heapq.heappush(frontier, (A[c], c))
+            if c + 1 < n:
+                heapq.heappush(frontier, (A[c + 1], c + 1))
 
-        return sortedArray
+    def nsmallest(self, k):
+        return list(islice(self.iterSorted(), k))
 
     def getMinimum(self):
 
@@ -138,5 +296,6 @@ if __name__ == "__main__":
     minHeap = MinHeap([5, 2, 1, 3, 7, 8])
     print(minHeap.getHeap())
     print(minHeap.getSortedArray())
+    print(minHeap.nsmallest(3))
     print(minHeap.getMinimum())
     print(minHeap.getMaximum())
\ No newline at end of file
@@ -0,0 +1,198 @@
+import operator
+
+
+class MinMaxHeap:
+    """
+    Min-Max-Heap (Atkinson et al.): Knoten auf geraden Ebenen sind kleiner
+    als alle Nachfahren, Knoten auf ungeraden Ebenen groesser. Das Minimum
+    steht damit in A[0], das Maximum in A[1] oder A[2].
+
+    peek_min/peek_max in O(1), insert/pop_min/pop_max in O(log n). Die
+    Methodennamen von MinHeap/MaxHeap stehen zusaetzlich zur Verfuegung.
+    """
+
+    def __init__(self, A):
+        self.A = A
+        self.heapSize = len(A)
+        self.buildMinMaxHeap()
+
+    """ HAUPTMETHODEN """
+
+    def buildMinMaxHeap(self):
+
+        self.heapSize = len(self.A)
+
+        for i in range(self.heapSize // 2 - 1, -1, -1):
+            self.trickleDown(i)
+
+    def insert(self, key):
+
+        self.A.append(key)
+        self.heapSize = len(self.A)
+
+        self.bubbleUp(self.heapSize - 1)
+
+    def peek_min(self):
+
+        if self.heapSize == 0:
+            raise Exception("Heap is empty")
+
+        return self.A[0]
+
+    def peek_max(self):
+
+        if self.heapSize == 0:
+            raise Exception("Heap is empty")
+
+        return self.A[self.maxIndex()]
+
+    def pop_min(self):
+
+        if self.heapSize == 0:
+            raise Exception("Heap is empty")
+
+        return self.removeAt(0)
+
+    def pop_max(self):
+
+        if self.heapSize == 0:
+            raise Exception("Heap is empty")
+
+        return self.removeAt(self.maxIndex())
+
+    """ HILFSFUNKTIONEN IM BAUM """
+
+    def maxIndex(self):
+
+        if self.heapSize == 1:
+            return 0
+        if self.heapSize == 2 or self.A[1] > self.A[2]:
+            return 1
+        return 2
+
+    def isMinLevel(self, i):
+        return (i + 1).bit_length() % 2 == 1
+
+    def removeAt(self, i):
+
+        A = self.A
+        item = A[i]
+        last = A.pop()
+        self.heapSize = len(A)
+
+        if i < self.heapSize:
+            A[i] = last
+            self.trickleDown(i)
+
+        return item
+
+    def bubbleUp(self, i):
+
+        if i == 0:
+            return
+
+        A = self.A
+        p = (i - 1) >> 1
+
+        if self.isMinLevel(i):
+            if A[i] > A[p]:
+                A[i], A[p] = A[p], A[i]
+                self.bubbleUpGrandparents(p, operator.gt)
+            else:
+                self.bubbleUpGrandparents(i, operator.lt)
+        else:
+            if A[i] < A[p]:
+                A[i], A[p] = A[p], A[i]
+                self.bubbleUpGrandparents(p, operator.lt)
+            else:
+                self.bubbleUpGrandparents(i, operator.gt)
+
+    def bubbleUpGrandparents(self, i, before):
+
+        A = self.A
+        item = A[i]
+
+        while i > 2:
+            g = (((i - 1) >> 1) - 1) >> 1
+            if not before(item, A[g]):
+                break
+            A[i] = A[g]
+            i = g
+
+        A[i] = item
+
+    def trickleDown(self, i):
+        """
+        Auf einer Min-Ebene wandert A[i] zum kleinsten Kind oder Enkel,
+        auf einer Max-Ebene zum groessten. Nach einem Tausch mit einem Enkel
+        wird noch gegen den Elternknoten dazwischen korrigiert.
+        """
+
+        A = self.A
+        n = self.heapSize
+        before = operator.lt if self.isMinLevel(i) else operator.gt
+
+        while True:
+
+            c = 2 * i + 1
+            if c >= n:
+                return
+
+            # bester Kandidat unter Kindern und Enkeln
+            m = c
+            for j in (c + 1, 2 * c + 1, 2 * c + 2, 2 * c + 3, 2 * c + 4):
+                if j < n and before(A[j], A[m]):
+                    m = j
+
+            if not before(A[m], A[i]):
+                return
+
+            A[i], A[m] = A[m], A[i]
+
+            if m <= c + 1:
+                return
+
+            p = (m - 1) >> 1
+            if before(A[p], A[m]):
+                A[p], A[m] = A[m], A[p]
+
+            i = m
+
+    """ GETTER METHODEN (wie MinHeap/MaxHeap) """
+
+    def getHeap(self):
+        return self.A
+
+    def getSortedArray(self):
+        return sorted(self.A[: self.heapSize])
+
+    def getMinimum(self):
+        return self.peek_min()
+
+    def getMaximum(self):
+        return self.peek_max()
+
+    def extractMin(self):
+        return self.pop_min()
+
+    def extractMax(self):
+        return self.pop_max()
+
+    def minHeapInsert(self, key):
+        self.insert(key)
+
+    def maxHeapInsert(self, key):
+        self.insert(key)
+
+    def __len__(self):
+        return self.heapSize
+
+
+if __name__ == "__main__":
+
+    heap = MinMaxHeap([5, 2, 1, 3, 7, 8])
+    print(heap.getHeap())
+    print(heap.getMinimum(), heap.getMaximum())
+    heap.insert(10)
+    print(heap.pop_max(), heap.pop_min())
+    print(heap.getSortedArray())
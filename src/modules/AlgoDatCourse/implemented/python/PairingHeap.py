@@ -0,0 +1,191 @@
+class PairingNode:
+
+    # Ohne __dict__: pro Knoten nur die fuenf Slots
+    __slots__ = ("key", "value", "child", "sibling", "prev")
+
+    def __init__(self, key, value=None):
+        self.key = key
+        self.value = value
+        self.child = None    # linkestes Kind
+        self.sibling = None  # rechter Geschwisterknoten
+        self.prev = None     # Elternknoten beim linkesten Kind, sonst linker Geschwisterknoten
+
+
+class PairingHeap:
+    """
+    Zeigerbasierter MinHeap. insert und meld in O(1), extractMin amortisiert
+    O(log n), decreaseKey ueber das von insert gelieferte Knoten-Handle
+    (amortisiert o(log n), in der Praxis nahezu konstant).
+    """
+
+    def __init__(self):
+        self.root = None
+        self.heapSize = 0
+
+    """ HAUPTMETHODEN """
+
+    def insert(self, key, value=None):
+
+        node = PairingNode(key, value)
+
+        self.root = node if self.root is None else self.link(self.root, node)
+        self.heapSize += 1
+
+        return node
+
+    def extractMin(self):
+
+        if self.root is None:
+            raise Exception("Heap is empty")
+
+        root = self.root
+
+        self.root = self.mergePairs(root.child)
+        self.heapSize -= 1
+
+        root.child = None
+
+        return root.key, root.value
+
+    def decreaseKey(self, node, key):
+
+        self.checkHandle(node)
+
+        if key > node.key:
+            raise Exception("Error: new key is larger than current key")
+
+        node.key = key
+
+        if node is not self.root:
+            self.detach(node)
+            self.root = self.link(self.root, node)
+
+    def delete(self, node):
+
+        self.checkHandle(node)
+
+        if node is self.root:
+            return self.extractMin()
+
+        self.detach(node)
+
+        rest = self.mergePairs(node.child)
+        node.child = None
+
+        if rest is not None:
+            self.root = self.link(self.root, rest)
+
+        self.heapSize -= 1
+
+        return node.key, node.value
+
+    def meld(self, other):
+        """Uebernimmt alle Knoten aus other, other ist danach leer."""
+
+        if other.root is not None:
+            self.root = other.root if self.root is None else self.link(self.root, other.root)
+
+        self.heapSize += other.heapSize
+
+        other.root = None
+        other.heapSize = 0
+
+    """ HILFSFUNKTIONEN IM BAUM """
+
+    def checkHandle(self, node):
+        """Nur die Wurzel hat kein prev; ein Knoten ohne prev, der nicht Wurzel ist, wurde bereits entnommen."""
+
+        if node.prev is None and node is not self.root:
+            raise KeyError(f"Unbekanntes oder entferntes Handle: {node.key}")
+
+    def link(self, a, b):
+        """Haengt die Wurzel mit dem groesseren Schluessel als linkestes Kind unter die andere."""
+
+        if b.key < a.key:
+            a, b = b, a
+
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+
+        return a
+
+    def detach(self, node):
+
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+
+        node.prev = None
+        node.sibling = None
+
+    def mergePairs(self, first):
+        """
+        Zwei-Pass-Verschmelzung der Geschwisterliste ab first, iterativ:
+        erst paarweise von links nach rechts, dann von rechts nach links
+        alles zu einer Wurzel.
+        """
+
+        if first is None:
+            return None
+
+        pairs = []
+        node = first
+
+        while node is not None:
+
+            a = node
+            b = a.sibling
+
+            if b is None:
+                a.prev = a.sibling = None
+                pairs.append(a)
+                break
+
+            node = b.sibling
+            a.prev = a.sibling = None
+            b.prev = b.sibling = None
+            pairs.append(self.link(a, b))
+
+        root = pairs.pop()
+        while pairs:
+            root = self.link(pairs.pop(), root)
+
+        root.prev = None
+
+        return root
+
+    """ GETTER METHODEN """
+
+    def getMinimum(self):
+
+        if self.root is None:
+            raise Exception("Heap is empty")
+
+        return self.root.key, self.root.value
+
+    def __len__(self):
+        return self.heapSize
+
+
+if __name__ == "__main__":
+
+    heap = PairingHeap()
+    nodes = {name: heap.insert(key, name) for name, key in [("A", 7), ("B", 3), ("C", 9), ("D", 5)]}
+
+    heap.decreaseKey(nodes["C"], 1)
+    heap.delete(nodes["D"])
+
+    while len(heap):
+        print(heap.extractMin())
+
+    try:
+        heap.delete(nodes["D"])
+    except KeyError as e:
+        print("KeyError:", e)
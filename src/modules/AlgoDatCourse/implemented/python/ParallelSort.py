@@ -0,0 +1,250 @@
+"""
+Paralleles Sortieren von Ganzzahlen auf mehreren Kernen.
+
+Die Daten liegen als int64 in einem multiprocessing.shared_memory-Block.
+An die Worker-Prozesse werden nur der Name des Blocks und Bereichsgrenzen
+uebergeben, die Daten selbst werden nie gepickelt.
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from Mergesort import Mergesort
+from MinHeap import MinHeap
+from Radixsort import Radixsort
+
+ITEMSIZE = array("q").itemsize
+
+# Darunter lohnt sich der Start der Prozesse nicht
+MIN_PARALLEL_SIZE = 10000
+
+
+""" SHARED MEMORY """
+
+
+def _create(n):
+    return shared_memory.SharedMemory(create=True, size=max(1, n) * ITEMSIZE)
+
+
+def _attach(name):
+    # Die Worker teilen sich den resource_tracker des Elternprozesses,
+    # das erneute Registrieren beim Anhaengen ist dort ohne Wirkung
+    return shared_memory.SharedMemory(name=name)
+
+
+def _chunks(n, workers):
+
+    step = -(-n // workers)
+
+    return [(lo, min(n, lo + step)) for lo in range(0, n, step)]
+
+
+""" WORKER (laufen in eigenen Prozessen) """
+
+
+def _sort_chunk(name, lo, hi):
+
+    shm = _attach(name)
+    view = shm.buf.cast("q")
+
+    part = view[lo:hi].tolist()
+    Mergesort().mergesort_bottom_up(part)
+    view[lo:hi] = array("q", part)
+
+    view.release()
+    shm.close()
+
+
+def _digits(values, exp, basis, shift, bias):
+
+    if shift is None:
+        return [((x + bias) // exp) % basis for x in values]
+
+    mask = basis - 1
+    return [((x + bias) >> shift) & mask for x in values]
+
+
+def _histogram(name, lo, hi, exp, basis, shift, bias):
+
+    shm = _attach(name)
+    view = shm.buf.cast("q")
+
+    C = [0] * basis
+    for digit in _digits(view[lo:hi].tolist(), exp, basis, shift, bias):
+        C[digit] += 1
+
+    view.release()
+    shm.close()
+
+    return C
+
+
+def _scatter(src_name, dst_name, lo, hi, exp, basis, shift, bias, offsets):
+
+    src = _attach(src_name)
+    dst = _attach(dst_name)
+    src_view = src.buf.cast("q")
+    dst_view = dst.buf.cast("q")
+
+    values = src_view[lo:hi].tolist()
+
+    for x, digit in zip(values, _digits(values, exp, basis, shift, bias)):
+        dst_view[offsets[digit]] = x
+        offsets[digit] += 1
+
+    src_view.release()
+    dst_view.release()
+    src.close()
+    dst.close()
+
+
+""" K-WEGE-MISCHEN """
+
+
+def kway_merge(view, runs, out):
+    """
+    Mischt die sortierten Bereiche view[lo:hi] aus `runs` nach out.
+    Der MinHeap haelt pro Run ein Tupel (Wert, Run-Nr., Position).
+    """
+
+    ends = [hi for _, hi in runs]
+    heap = MinHeap([(view[lo], c, lo) for c, (lo, hi) in enumerate(runs) if lo < hi])
+
+    k = 0
+
+    while heap.heapSize > 0:
+
+        value, c, i = heap.A[0]
+        out[k] = value
+        k += 1
+
+        i += 1
+        if i < ends[c]:
+            heap.A[0] = (view[i], c, i)
+            heap.minHeapify(0)
+        else:
+            heap.extractMin()
+
+    return out
+
+
+""" PARALLELE SORTIERER """
+
+
+def parallel_mergesort(A, workers=None):
+    """
+    Sortiert die Ganzzahlen in A: jeder Worker sortiert einen Block im
+    Shared Memory, anschliessend werden die Bloecke per MinHeap gemischt.
+    """
+
+    n = len(A)
+    workers = workers or os.cpu_count() or 1
+
+    if n < MIN_PARALLEL_SIZE or workers == 1:
+        return Mergesort().mergesort_bottom_up(A)
+
+    shm = _create(n)
+    view = shm.buf.cast("q")
+
+    try:
+        view[:n] = array("q", A)
+        runs = _chunks(n, workers)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_sort_chunk, [shm.name] * len(runs), *zip(*runs)))
+
+        kway_merge(view, runs, A)
+    finally:
+        view.release()
+        shm.close()
+        shm.unlink()
+
+    return A
+
+
+def parallel_radixsort(A, d, basis=10, workers=None, radix_bits=None, bias=0):
+    """
+    LSD-Radixsort fuer int64-Werte. Pro Stelle zaehlen die Worker ihre
+    Bloecke parallel, aus den Histogrammen werden stabile Startpositionen je
+    Block und Ziffer berechnet, dann verteilen die Worker ihre Elemente
+    parallel in den zweiten Puffer. Ziffern werden aus x + bias gebildet
+    (siehe Radixsort.sign_bias), mit radix_bits per Shift und Maske.
+    """
+
+    n = len(A)
+    workers = workers or os.cpu_count() or 1
+
+    if radix_bits is not None:
+        basis = 1 << radix_bits
+
+    if n < MIN_PARALLEL_SIZE or workers == 1:
+        return _serial_radixsort(A, d, basis, radix_bits, bias)
+
+    src = _create(n)
+    dst = _create(n)
+    view = src.buf.cast("q")
+
+    try:
+        view[:n] = array("q", A)
+        view.release()
+
+        runs = _chunks(n, workers) if n else []
+        los, his = zip(*runs) if runs else ((), ())
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+
+            exp = 1
+
+            for stelle in range(d):
+
+                shift = None if radix_bits is None else stelle * radix_bits
+                digitArgs = ([exp] * len(runs), [basis] * len(runs),
+                             [shift] * len(runs), [bias] * len(runs))
+
+                hists = list(pool.map(
+                    _histogram, [src.name] * len(runs), los, his, *digitArgs,
+                ))
+
+                offsets = [[0] * basis for _ in runs]
+                total = 0
+                for digit in range(basis):
+                    for c, C in enumerate(hists):
+                        offsets[c][digit] = total
+                        total += C[digit]
+
+                list(pool.map(
+                    _scatter, [src.name] * len(runs), [dst.name] * len(runs),
+                    los, his, *digitArgs, offsets,
+                ))
+
+                src, dst = dst, src
+                exp *= basis
+
+        view = src.buf.cast("q")
+        A[:] = view[:n].tolist()
+    finally:
+        view.release()
+        for shm in (src, dst):
+            shm.close()
+            shm.unlink()
+
+    return A
+
+
+def _serial_radixsort(A, d, basis, radix_bits, bias):
+    """Dieselben Ziffern wie parallel_radixsort, aber im aufrufenden Prozess; sortiert A an Ort und Stelle."""
+
+    keys = list(A)
+    distribute = Radixsort().distribute
+    exp = 1
+
+    for stelle in range(d):
+        shift = None if radix_bits is None else stelle * radix_bits
+        keys = distribute(keys, None, _digits(keys, exp, basis, shift, bias), basis)[0]
+        exp *= basis
+
+    A[:] = keys
+
+    return A
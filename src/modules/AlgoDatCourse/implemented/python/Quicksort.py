@@ -1,6 +1,19 @@
-﻿class Quicksort:
+﻿from Heapsort import Heapsort
 
-    def quicksort(self, A, p, r):
+# Teilbereiche bis zu dieser Laenge sortiert Insertionsort
+INSERTION_CUTOFF = 16
+
+# Ab dieser Laenge wird das Pivot per Ninther (Median aus drei Medianen) bestimmt
+NINTHER_THRESHOLD = 128
+
+
+class Quicksort:
+
+    def quicksort(self, A, p, r, introsort=False):
+
+        if introsort:
+            self.introsort(A, p, r)
+            return
 
         if p < r:
 
@@ -23,6 +36,122 @@
 
         return i + 1
 
+    """ INTROSORT """
+
+    def introsort(self, A, p=0, r=None):
+        """
+        Iterativer Quicksort mit explizitem Stack: der groessere Teilbereich
+        wird abgelegt, der kleinere sofort weiterbearbeitet, damit der Stack
+        hoechstens O(log n) Eintraege hat. Ueberschreitet die Tiefe 2 * log n,
+        wird der Teilbereich per Heapsort fertig sortiert.
+        """
+
+        if r is None:
+            r = len(A) - 1
+
+        if p >= r:
+            return A
+
+        maxDepth = 2 * (r - p + 1).bit_length()
+        stack = [(p, r, 0)]
+
+        while stack:
+
+            lo, hi, depth = stack.pop()
+
+            while hi - lo + 1 > INSERTION_CUTOFF:
+
+                if depth > maxDepth:
+                    self.heapsortRange(A, lo, hi)
+                    break
+
+                depth += 1
+
+                x = self.choosePivot(A, lo, hi)
+                lt, gt = self.partition3(A, lo, hi, x)
+
+                if lt - lo < hi - gt:
+                    stack.append((gt + 1, hi, depth))
+                    hi = lt - 1
+                else:
+                    stack.append((lo, lt - 1, depth))
+                    lo = gt + 1
+            else:
+                self.insertionsort(A, lo, hi)
+
+        return A
+
+    def partition3(self, A, p, r, x):
+        """
+        Dreiwege-Partitionierung (Dutch National Flag) um den Pivotwert x.
+        Danach gilt A[p..lt-1] < x, A[lt..gt] == x und A[gt+1..r] > x.
+        """
+
+        lt = p
+        i = p
+        gt = r
+
+        while i <= gt:
+            a = A[i]
+            if a < x:
+                A[i] = A[lt]
+                A[lt] = a
+                lt += 1
+                i += 1
+            elif x < a:
+                A[i] = A[gt]
+                A[gt] = a
+                gt -= 1
+            else:
+                i += 1
+
+        return lt, gt
+
+    def choosePivot(self, A, p, r):
+
+        m = (p + r) // 2
+
+        if r - p + 1 < NINTHER_THRESHOLD:
+            return self.medianOfThree(A[p], A[m], A[r])
+
+        s = (r - p) // 8
+
+        return self.medianOfThree(
+            self.medianOfThree(A[p], A[p + s], A[p + 2 * s]),
+            self.medianOfThree(A[m - s], A[m], A[m + s]),
+            self.medianOfThree(A[r - 2 * s], A[r - s], A[r]),
+        )
+
+    def medianOfThree(self, a, b, c):
+
+        if a < b:
+            if b < c:
+                return b
+            return c if a < c else a
+
+        if a < c:
+            return a
+        return c if b < c else b
+
+    def insertionsort(self, A, p, r):
+
+        for j in range(p + 1, r + 1):
+
+            key = A[j]
+            i = j - 1
+
+            while i >= p and key < A[i]:
+                A[i + 1] = A[i]
+                i -= 1
+
+            A[i + 1] = key
+
+    def heapsortRange(self, A, p, r):
+
+        part = A[p : r + 1]
+        Heapsort().heapsort(part)
+        A[p : r + 1] = part
+
 
 if __name__ == "__main__":
 
@@ -30,3 +159,7 @@ if __name__ == "__main__":
     qs = Quicksort()
     qs.quicksort(A, 0, len(A) - 1)
     print(A)
+
+    B = list(range(5000)) + [7] * 5000
+    qs.quicksort(B, 0, len(B) - 1, introsort=True)
+    print(B == sorted(B))
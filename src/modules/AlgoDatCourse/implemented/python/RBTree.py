@@ -1,8 +1,16 @@
-RED = "RED"
-BLACK = "BLACK"
+import Snapshot
+
+# Farbe als ein Bit statt als String
+RED = True
+BLACK = False
+
+COLOR_NAMES = {RED: "RED", BLACK: "BLACK"}
 
 
 class Node:
+    # Ohne __dict__ pro Instanz, bei Millionen Knoten spart das den Grossteil des Speichers
+    __slots__ = ("key", "value", "color", "left", "right", "parent", "size")
+
     def __init__(self, key=None, value=None, color=BLACK):
         self.key = key
         self.value = value
@@ -10,12 +18,17 @@ class Node:
         self.left = None
         self.right = None
         self.parent = None
+        self.size = 1  # Anzahl der Knoten im Teilbaum (Order-Statistic-Baum)
 
 
 class RBTree:
+    # Von Instrumentation gesetzt; sonst kostet der Haken nur einen None-Test pro Fixup-Runde
+    probe = None
+
     def __init__(self):
         self.nil = Node()
         self.nil.left = self.nil.right = self.nil.parent = self.nil
+        self.nil.size = 0
         self.root = self.nil
 
     def search(self, key):
@@ -72,6 +85,8 @@ class RBTree:
             x.parent.right = y
         y.left = x
         x.parent = y
+        y.size = x.size
+        x.size = x.left.size + x.right.size + 1
 
     def right_rotate(self, y):
         x = y.left
@@ -87,6 +102,8 @@ class RBTree:
             y.parent.left = x
         x.right = y
         y.parent = x
+        x.size = y.size
+        y.size = y.left.size + y.right.size + 1
 
     def insert(self, key, value=None):
         z = Node(key, value, RED)
@@ -109,11 +126,15 @@ class RBTree:
             y.left = z
         else:
             y.right = z
+        self._update_sizes(y, 1)
         self._insert_fixup(z)
         return z
 
     def _insert_fixup(self, z):
+        probe = self.probe
         while z.parent.color == RED:
+            if probe is not None:
+                probe("fixup", "insert")
             if z.parent == z.parent.parent.left:
                 y = z.parent.parent.right
                 if y.color == RED:
@@ -159,6 +180,8 @@ class RBTree:
             return False
         y = z
         y_original_color = y.color
+        if z.left == self.nil or z.right == self.nil:
+            self._update_sizes(z.parent, -1)
         if z.left == self.nil:
             x = z.right
             self.transplant(z, z.right)
@@ -168,6 +191,7 @@ class RBTree:
         else:
             y = self.minimum(z.right)
             y_original_color = y.color
+            self._update_sizes(y.parent, -1)
             x = y.right
             if y.parent == z:
                 x.parent = y
@@ -179,12 +203,16 @@ class RBTree:
             y.left = z.left
             y.left.parent = y
             y.color = z.color
+            y.size = z.size
         if y_original_color == BLACK:
             self._delete_fixup(x)
         return True
 
     def _delete_fixup(self, x):
+        probe = self.probe
         while x != self.root and x.color == BLACK:
+            if probe is not None:
+                probe("fixup", "delete")
             if x == x.parent.left:
                 w = x.parent.right
                 if w.color == RED:
@@ -229,18 +257,234 @@ class RBTree:
                     x = self.root
         x.color = BLACK
 
+    def _update_sizes(self, node, delta):
+        while node != self.nil:
+            node.size += delta
+            node = node.parent
+
+    def rank(self, key):
+        """Anzahl der Schluessel kleiner als key (= Index von key in inorder())."""
+        return self._count_less(key, False)
+
+    def select(self, i):
+        """Knoten mit dem i-kleinsten Schluessel, 0-basiert."""
+        if not 0 <= i < self.root.size:
+            raise IndexError(f"select({i}) ausserhalb von 0..{self.root.size - 1}")
+        x = self.root
+        while True:
+            left = x.left.size
+            if i < left:
+                x = x.left
+            elif i == left:
+                return x
+            else:
+                i -= left + 1
+                x = x.right
+
+    def count_range(self, lo, hi):
+        """Anzahl der Schluessel k mit lo <= k <= hi."""
+        return max(0, self._count_less(hi, True) - self._count_less(lo, False))
+
+    def _count_less(self, key, inclusive):
+        r = 0
+        x = self.root
+        while x != self.nil:
+            if x.key < key or (inclusive and x.key == key):
+                r += x.left.size + 1
+                x = x.right
+            else:
+                x = x.left
+        return r
+
+    def __len__(self):
+        return self.root.size
+
+    def ceiling(self, key):
+        """Knoten mit dem kleinsten Schluessel >= key oder None."""
+        best = None
+        x = self.root
+        while x != self.nil:
+            if x.key < key:
+                x = x.right
+            else:
+                best = x
+                x = x.left
+        return best
+
+    def floor(self, key):
+        """Knoten mit dem groessten Schluessel <= key oder None."""
+        best = None
+        x = self.root
+        while x != self.nil:
+            if key < x.key:
+                x = x.left
+            else:
+                best = x
+                x = x.right
+        return best
+
+    def nodes(self, lo=None, hi=None, reverse=False):
+        """
+        Liefert die Knoten mit lo <= key <= hi lazy in Sortierreihenfolge.
+        Der Einstieg kostet O(log n), jeder weitere Schritt laeuft ueber
+        die Elternzeiger (amortisiert O(1)), insgesamt also O(log n + k).
+        """
+        if not reverse:
+            x = self.minimum() if lo is None else self.ceiling(lo)
+            while x is not None and (hi is None or not hi < x.key):
+                yield x
+                x = self.successor(x)
+        else:
+            x = self.maximum() if hi is None else self.floor(hi)
+            while x is not None and (lo is None or not x.key < lo):
+                yield x
+                x = self.predecessor(x)
+
+    def items(self, lo=None, hi=None, reverse=False):
+        for node in self.nodes(lo, hi, reverse):
+            yield node.key, node.value
+
+    def keys(self, lo=None, hi=None, reverse=False):
+        for node in self.nodes(lo, hi, reverse):
+            yield node.key
+
+    def values(self, lo=None, hi=None, reverse=False):
+        for node in self.nodes(lo, hi, reverse):
+            yield node.value
+
+    @classmethod
+    def from_sorted(cls, items):
+        """
+        Baut aus streng aufsteigend sortierten (key, value)-Paaren in O(n)
+        einen perfekt balancierten Baum, ohne Rekursion und ohne Rotationen.
+        Alle Knoten sind schwarz, nur die unterste Ebene ist rot (sofern der
+        Baum mehr als einen Knoten hat); so haben alle Pfade dieselbe
+        Schwarzhoehe.
+        """
+        tree = cls()
+        nodes = [Node(key, value, BLACK) for key, value in items]
+        n = len(nodes)
+
+        for i in range(1, n):
+            if not nodes[i - 1].key < nodes[i].key:
+                raise ValueError("from_sorted erwartet streng aufsteigende Schluessel")
+
+        if n == 0:
+            return tree
+
+        nil = tree.nil
+        redDepth = n.bit_length() - 1
+        stack = [(0, n - 1, nil, False, 0)]
+
+        while stack:
+            lo, hi, parent, isLeft, depth = stack.pop()
+            mid = (lo + hi) // 2
+            z = nodes[mid]
+            z.left = z.right = nil
+            z.parent = parent
+            z.size = hi - lo + 1
+            if depth == redDepth and depth > 0:
+                z.color = RED
+            if parent == nil:
+                tree.root = z
+            elif isLeft:
+                parent.left = z
+            else:
+                parent.right = z
+            if lo < mid:
+                stack.append((lo, mid - 1, z, True, depth + 1))
+            if mid < hi:
+                stack.append((mid + 1, hi, z, False, depth + 1))
+
+        return tree
+
+    def union(self, other):
+        """Neuer Baum mit allen Schluesseln beider Baeume; bei gleichem Schluessel gilt der Wert aus other."""
+        return type(self).from_sorted(self._merge_items(self.items(), other.items(), True))
+
+    def difference(self, other):
+        """Neuer Baum mit den Schluesseln, die nur in diesem Baum vorkommen."""
+        return type(self).from_sorted(self._merge_items(self.items(), other.items(), False))
+
+    @staticmethod
+    def _merge_items(a, b, union):
+        x = next(a, None)
+        y = next(b, None)
+        while x is not None and y is not None:
+            if x[0] < y[0]:
+                yield x
+                x = next(a, None)
+            elif y[0] < x[0]:
+                if union:
+                    yield y
+                y = next(b, None)
+            else:
+                if union:
+                    yield y
+                x = next(a, None)
+                y = next(b, None)
+        while x is not None:
+            yield x
+            x = next(a, None)
+        while union and y is not None:
+            yield y
+            y = next(b, None)
+
+    def save(self, path):
+        """Schreibt die sortierten Schluessel und Werte als binaeren Snapshot (siehe Snapshot.py)."""
+        Snapshot.save_rbtree(self, path)
+
+    @classmethod
+    def load(cls, path, readonly=False):
+        """
+        Laedt einen Snapshot per mmap und baut den Baum mit from_sorted in O(n).
+        Mit readonly=True entsteht kein Baum, sondern ein ReadOnlyRBTree, der
+        search/rank/select/count_range direkt auf der Datei beantwortet.
+        """
+        if readonly:
+            return Snapshot.ReadOnlyRBTree(path)
+        return Snapshot.load_rbtree(path, cls)
+
+    def cursor(self, key=None):
+        """Cursor auf dem kleinsten Schluessel >= key (ohne key: auf dem Minimum)."""
+        return Cursor(self, self.minimum() if key is None else self.ceiling(key))
+
     def inorder(self):
-        result = []
+        return [(node.key, node.value, COLOR_NAMES[node.color]) for node in self.nodes()]
+
+
+class Cursor:
+    """
+    Position in einem RBTree. next() und prev() gehen ueber die Elternzeiger
+    zum Nachbarn, ohne erneut von der Wurzel zu suchen. Nach Einfuegen oder
+    Loeschen im Baum ist ein Cursor nicht mehr gueltig.
+    """
+
+    def __init__(self, tree, node):
+        self.tree = tree
+        self.node = node
+
+    @property
+    def valid(self):
+        return self.node is not None
+
+    @property
+    def key(self):
+        return self.node.key
+
+    @property
+    def value(self):
+        return self.node.value
 
-        def walk(node):
-            if node == self.nil:
-                return
-            walk(node.left)
-            result.append((node.key, node.value, node.color))
-            walk(node.right)
+    def next(self):
+        if self.node is not None:
+            self.node = self.tree.successor(self.node)
+        return self.valid
 
-        walk(self.root)
-        return result
+    def prev(self):
+        if self.node is not None:
+            self.node = self.tree.predecessor(self.node)
+        return self.valid
 
 
 if __name__ == "__main__":
@@ -251,3 +495,5 @@ if __name__ == "__main__":
     print(tree.search(19).value)
     tree.delete(12)
     print(tree.inorder())
+    print(tree.rank(38), tree.select(2).key, tree.count_range(10, 40))
+    print(list(tree.keys(10, 40, reverse=True)))
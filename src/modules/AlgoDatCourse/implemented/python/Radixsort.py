@@ -1,32 +1,232 @@
-﻿class Radixsort:
+﻿import Backend
 
-    def radixsort(self, A, d):
 
-        basis = 10
+# Bereiche bis zu dieser Laenge sortiert radixsort_msd per Vergleich fertig
+MSD_CUTOFF = 32
 
-        for stelle in range(1, d + 1):
-            A = self.countingsort_by_digit(A, basis, stelle)
 
-        return A
+class Radixsort:
+
+    def radixsort(self, A, d=None, parallel=False, workers=None, backend="auto",
+                  radix_bits=None, key=None):
+        """
+        LSD-Radixsort. Ohne radix_bits wird wie gewohnt zur Basis 10 sortiert,
+        mit radix_bits=8 oder 16 byteweise bzw. in 16-Bit-Ziffern per Shift und
+        Maske. Ohne d wird die Stellenzahl aus dem groessten Betrag bestimmt.
+        Negative Zahlen werden durch Kippen des Vorzeichenbits (hier: Addieren
+        von 2^(w-1)) in eine ordnungserhaltende nichtnegative Form gebracht.
+        Mit key= werden beliebige Objekte stabil nach key(x) sortiert.
+        """
+
+        basis = 10 if radix_bits is None else 1 << radix_bits
+
+        if key is not None and (parallel or backend == "numpy"):
+            raise ValueError("key= wird nur vom Python-Backend unterstuetzt")
+
+        if key is None and not parallel and Backend.resolve(backend, A) == "numpy":
+            return Backend.like(self.radixsort_numpy(A, d, basis, radix_bits), A)
+
+        keys = list(A) if key is None else [key(x) for x in A]
+
+        if not keys:
+            return Backend.like([], A) if key is None else []
+
+        lo = min(keys)
+        hi = max(keys)
+
+        bias = self.sign_bias(lo, hi)
+
+        # Ein vorgegebenes d zaehlt die Stellen des unverschobenen Bereichs,
+        # nach dem Verschieben um bias koennen es mehr sein
+        if d is None or bias:
+            d = max(d or 0, self.digit_count(hi + bias, basis, radix_bits))
+
+        if parallel:
+            from ParallelSort import parallel_radixsort
+            return parallel_radixsort(A, d, basis, workers, radix_bits=radix_bits, bias=bias)
+
+        if bias:
+            keys = [x + bias for x in keys]
+
+        values = None if key is None else list(A)
+        mask = basis - 1
+        exp = 1
+
+        for stelle in range(d):
+
+            if radix_bits is None:
+                digits = [(x // exp) % basis for x in keys]
+                exp *= basis
+            else:
+                shift = stelle * radix_bits
+                digits = [(x >> shift) & mask for x in keys]
+
+            keys, values = self.distribute(keys, values, digits, basis)
+
+        if key is not None:
+            return values
+
+        if bias:
+            keys = [x - bias for x in keys]
+
+        return Backend.like(keys, A)
 
     def countingsort_by_digit(self, A, basis, stelle):
 
-        n = len(A)
-        B = [0] * n
+        # Ziffern nur einmal pro Durchlauf berechnen
+        exp = basis ** (stelle - 1)
+        digits = [(x // exp) % basis for x in A]
+
+        return self.distribute(A, None, digits, basis)[0]
+
+    def distribute(self, keys, values, digits, basis):
+        """
+        Stabiler Countingsort-Schritt nach den vorberechneten Ziffern.
+        values (oder None) wird parallel zu keys mitbewegt.
+        """
+
+        n = len(keys)
         C = [0] * basis
 
+        for digit in digits:
+            C[digit] += 1
+
+        # C[i] wird zur Startposition der Ziffer i
+        total = 0
+        for i in range(basis):
+            C[i], total = total, total + C[i]
+
+        B = [0] * n
+        W = None if values is None else [None] * n
+
         for j in range(n):
-            C[self.get_digit(A[j], stelle, basis)] = C[self.get_digit(A[j], stelle, basis)] + 1
+            digit = digits[j]
+            B[C[digit]] = keys[j]
+            if W is not None:
+                W[C[digit]] = values[j]
+            C[digit] += 1
+
+        return B, W
+
+    def sign_bias(self, lo, hi):
+        """
+        0 fuer nichtnegative Eingaben, sonst 2^(w-1) fuer die kleinste
+        Breite w, in der alle Werte als Zweierkomplement passen. x + bias
+        entspricht dort dem Kippen des Vorzeichenbits.
+        """
+
+        if lo >= 0:
+            return 0
+
+        return 1 << max(-lo, hi).bit_length()
+
+    def digit_count(self, maximum, basis, radix_bits=None):
+
+        if radix_bits is not None:
+            return max(1, -(-maximum.bit_length() // radix_bits))
+
+        d = 1
+        while maximum >= basis:
+            maximum //= basis
+            d += 1
+
+        return d
+
+    def radixsort_numpy(self, A, d, basis, radix_bits=None):
+        """
+        Vektorisiert: pro Stelle werden alle Ziffern auf einmal berechnet und
+        die Elemente per stabilem argsort verteilt. Fuer Ziffern bis 16 Bit
+        nutzt NumPy dafuer intern selbst einen Radixsort. Vorzeichenbehaftete
+        Arrays werden als vorzeichenlos mit gekipptem Vorzeichenbit sortiert.
+        """
+
+        np = Backend.np
+        a = Backend.to_numpy(A)
+
+        if basis <= 1 << 8:
+            digitType = np.uint8
+        elif basis <= 1 << 16:
+            digitType = np.uint16
+        else:
+            digitType = np.intp
+
+        signBit = 0
+        if a.dtype.kind == "i" and a.size and a.min() < 0:
+            signBit = 1 << (8 * a.dtype.itemsize - 1)
+
+        u = a.view(a.dtype.newbyteorder("=").str.replace("i", "u"))
+        if signBit:
+            u = u ^ u.dtype.type(signBit)
+
+        if d is None or signBit:
+            d = max(d or 0, self.digit_count(int(u.max()) if u.size else 0, basis, radix_bits))
+
+        limit = int(np.iinfo(u.dtype).max)
+        mask = basis - 1
+        exp = 1
+
+        for stelle in range(d):
+
+            if radix_bits is None:
+                # ab hier sind alle weiteren Ziffern 0, die Reihenfolge bleibt
+                if exp > limit:
+                    break
+                digits = (u // exp) % basis
+                exp *= basis
+            else:
+                shift = stelle * radix_bits
+                if shift >= 8 * u.dtype.itemsize:
+                    break
+                digits = (u >> shift) & mask
+
+            u = u[np.argsort(digits.astype(digitType), kind="stable")]
+
+        if signBit:
+            u = u ^ u.dtype.type(signBit)
+
+        return u.view(a.dtype)
+
+    def radixsort_msd(self, A, key=None):
+        """
+        MSD-Radixsort fuer Strings oder Bytes unterschiedlicher Laenge.
+        Verteilt iterativ (expliziter Stack) nach dem Zeichen an Position
+        `depth`; beendete Strings kommen vor alle laengeren. Kleine Bereiche
+        werden per stabilem Vergleichssortieren der Reststrings erledigt.
+        """
+
+        K = list(A) if key is None else [key(x) for x in A]
+        idx = list(range(len(K)))
+        stack = [(0, len(K), 0)]
+
+        while stack:
+
+            lo, hi, depth = stack.pop()
+
+            if hi - lo <= MSD_CUTOFF:
+                idx[lo:hi] = sorted(idx[lo:hi], key=lambda i: K[i][depth:])
+                continue
+
+            buckets = {}
 
-        for i in range(1, basis):
-            C[i] = C[i] + C[i - 1]
+            for i in idx[lo:hi]:
+                k = K[i]
+                if depth >= len(k):
+                    c = -1
+                elif isinstance(k, str):
+                    c = ord(k[depth])
+                else:
+                    c = k[depth]
+                buckets.setdefault(c, []).append(i)
 
-        for j in range(n - 1, -1, -1):
-            digit = self.get_digit(A[j], stelle, basis)
-            B[C[digit] - 1] = A[j]
-            C[digit] = C[digit] - 1
+            pos = lo
+            for c in sorted(buckets):
+                bucket = buckets[c]
+                idx[pos : pos + len(bucket)] = bucket
+                if c != -1 and len(bucket) > 1:
+                    stack.append((pos, pos + len(bucket), depth + 1))
+                pos += len(bucket)
 
-        return B
+        return [A[i] for i in idx]
 
     def get_digit(self, n, stelle, basis):
         return (n // basis ** (stelle - 1)) % basis
@@ -37,3 +237,6 @@ if __name__ == "__main__":
     A = [329, 457, 657, 839, 436, 720, 355]
     rs = Radixsort()
     print(rs.radixsort(A, 3))
+    print(rs.radixsort([-9, 9, 5, -3], 1))
+    print(rs.radixsort([-5, 2**40, 17, -2**35, 0], radix_bits=8))
+    print(rs.radixsort_msd(["bank", "ba", "banane", "apfel", "b"]))
@@ -0,0 +1,302 @@
+"""
+Binaeres Snapshot-Format fuer RBTree, MinHeap und MaxHeap.
+
+Aufbau einer Datei (native Byte-Reihenfolge):
+
+    Kopf     magic "ADS1", Art, Typ der Schluessel, Typ der Werte, n, heapSize
+    Spalte   Schluessel (beim Baum sortiert, beim Heap das rohe Array A)
+    Spalte   Werte (nur beim Baum, sonst Typ "n")
+
+Spaltentypen: "q" int64, "d" float64, "s" UTF-8-Strings (n+1 Offsets als
+int64, danach die Bytes, auf 8 Byte aufgefuellt), "n" keine Daten. Grossbuchstaben
+("Q", "D", "S") markieren Wertespalten, in denen auch None vorkommt: vor den
+Daten liegt dann eine Praesenz-Bitmap (Bit i gesetzt = Wert i vorhanden, auf
+8 Byte aufgefuellt), fehlende Werte stehen als 0, 0.0 bzw. "" in der Spalte.
+
+Geladen wird ueber mmap. ReadOnlyRBTree beantwortet search/rank/select
+direkt auf den gemappten Spalten per binaerer Suche, ohne Knoten zu bauen.
+"""
+
+import mmap
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+MAGIC = b"ADS1"
+HEADER = struct.Struct("=4sBccxQQ")
+
+KIND_RBTREE = 1
+KIND_MINHEAP = 2
+KIND_MAXHEAP = 3
+
+SnapshotEntry = namedtuple("SnapshotEntry", ["key", "value"])
+
+
+""" SCHREIBEN """
+
+
+NULL_FILL = {"q": 0, "d": 0.0, "s": ""}
+
+
+def column_type(values):
+
+    present = [v for v in values if v is not None]
+    if not present:
+        return "n"
+
+    if all(type(v) is int and -(1 << 63) <= v < (1 << 63) for v in present):
+        code = "q"
+    elif all(type(v) is float for v in present):
+        code = "d"
+    elif all(type(v) is str for v in present):
+        code = "s"
+    else:
+        raise TypeError("Snapshot unterstuetzt nur einheitlich int64, float, str oder None")
+
+    return code.upper() if len(present) < len(values) else code
+
+
+def write_column(f, code, values):
+
+    if code.isupper():
+        bitmap = bytearray((len(values) + 7) // 8)
+        for i, v in enumerate(values):
+            if v is not None:
+                bitmap[i >> 3] |= 1 << (i & 7)
+        f.write(bitmap)
+        f.write(b"\0" * (-len(bitmap) % 8))
+        code = code.lower()
+        values = [NULL_FILL[code] if v is None else v for v in values]
+
+    if code in "qd":
+        f.write(array(code, values).tobytes())
+
+    elif code == "s":
+        blobs = [v.encode("utf-8") for v in values]
+        offsets = array("q", [0])
+        total = 0
+        for blob in blobs:
+            total += len(blob)
+            offsets.append(total)
+        f.write(offsets.tobytes())
+        f.write(b"".join(blobs))
+        f.write(b"\0" * (-total % 8))
+
+
+def write_file(path, kind, keys, values, heapSize=0):
+
+    keyType = column_type(keys)
+    valueType = column_type(values)
+
+    if keys and (keyType == "n" or keyType.isupper()):
+        raise TypeError("Schluessel duerfen nicht None sein")
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, kind, keyType.encode(), valueType.encode(), len(keys), heapSize))
+        write_column(f, keyType, keys)
+        write_column(f, valueType, values)
+
+
+def save_rbtree(tree, path):
+
+    keys = []
+    values = []
+    for key, value in tree.items():
+        keys.append(key)
+        values.append(value)
+
+    write_file(path, KIND_RBTREE, keys, values)
+
+
+def save_heap(heap, path, kind):
+    write_file(path, kind, heap.A, [], heap.heapSize)
+
+
+""" LESEN """
+
+
+class Column:
+    """Spalte in einem gemappten Snapshot; Zugriff per Index ohne alles zu dekodieren."""
+
+    def __init__(self, buf, offset, code, n):
+
+        self.present = None
+        if code.isupper():
+            size = (n + 7) // 8
+            self.present = buf[offset : offset + size]
+            offset += size + (-size % 8)
+            code = code.lower()
+
+        self.code = code
+        self.n = n
+
+        if code in "qd":
+            self.view = buf[offset : offset + 8 * n].cast(code)
+            self.end = offset + 8 * n
+
+        elif code == "s":
+            self.offsets = buf[offset : offset + 8 * (n + 1)].cast("q")
+            start = offset + 8 * (n + 1)
+            total = self.offsets[n] if n else 0
+            self.blob = buf[start : start + total]
+            self.end = start + total + (-total % 8)
+
+        else:
+            self.end = offset
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+
+        if not -self.n <= i < self.n:
+            raise IndexError(i)
+        if i < 0:
+            i += self.n
+
+        if self.present is not None and not self.present[i >> 3] >> (i & 7) & 1:
+            return None
+        if self.code in "qd":
+            return self.view[i]
+        if self.code == "s":
+            return bytes(self.blob[self.offsets[i] : self.offsets[i + 1]]).decode("utf-8")
+        return None
+
+    def tolist(self):
+
+        if self.code in "qd" and self.present is None:
+            return self.view.tolist()
+        if self.code in "qds":
+            return [self[i] for i in range(self.n)]
+        return [None] * self.n
+
+    def release(self):
+        for name in ("view", "offsets", "blob", "present"):
+            if getattr(self, name, None) is not None:
+                getattr(self, name).release()
+
+
+class MappedSnapshot:
+
+    def __init__(self, path, kind):
+
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.buf = memoryview(self.map)
+
+        magic, fileKind, keyType, valueType, n, heapSize = HEADER.unpack_from(self.buf)
+
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} ist kein Snapshot")
+        if fileKind != kind:
+            self.close()
+            raise ValueError(f"{path} enthaelt Art {fileKind}, erwartet {kind}")
+
+        self.n = n
+        self.heapSize = heapSize
+        self.keys = Column(self.buf, HEADER.size, keyType.decode(), n)
+        self.values = Column(self.buf, self.keys.end, valueType.decode(), n)
+
+    def close(self):
+        for column in ("keys", "values"):
+            if hasattr(self, column):
+                getattr(self, column).release()
+        self.buf.release()
+        self.map.close()
+
+
+def load_rbtree(path, cls):
+
+    snapshot = MappedSnapshot(path, KIND_RBTREE)
+    try:
+        return cls.from_sorted(zip(snapshot.keys.tolist(), snapshot.values.tolist()))
+    finally:
+        snapshot.close()
+
+
+def load_heap(path, cls, kind):
+
+    snapshot = MappedSnapshot(path, kind)
+    try:
+        heap = cls([])
+        heap.A = snapshot.keys.tolist()
+        heap.heapSize = snapshot.heapSize
+        return heap
+    finally:
+        snapshot.close()
+
+
+class ReadOnlyRBTree:
+    """
+    Nur-Lese-Sicht auf einen RBTree-Snapshot. Die Schluessel liegen sortiert
+    in der gemappten Datei, daher laufen search, rank, select und count_range
+    per binaerer Suche in O(log n), ganz ohne Knotenobjekte.
+    """
+
+    def __init__(self, path):
+        self.snapshot = MappedSnapshot(path, KIND_RBTREE)
+        self.keys_ = self.snapshot.keys
+        self.values_ = self.snapshot.values
+
+    def search(self, key):
+        i = bisect_left(self.keys_, key)
+        if i < len(self.keys_) and self.keys_[i] == key:
+            return SnapshotEntry(key, self.values_[i])
+        return None
+
+    def rank(self, key):
+        return bisect_left(self.keys_, key)
+
+    def select(self, i):
+        if not 0 <= i < len(self.keys_):
+            raise IndexError(f"select({i}) ausserhalb von 0..{len(self.keys_) - 1}")
+        return SnapshotEntry(self.keys_[i], self.values_[i])
+
+    def count_range(self, lo, hi):
+        return max(0, bisect_right(self.keys_, hi) - bisect_left(self.keys_, lo))
+
+    def items(self, lo=None, hi=None, reverse=False):
+        start = 0 if lo is None else bisect_left(self.keys_, lo)
+        stop = len(self.keys_) if hi is None else bisect_right(self.keys_, hi)
+        indices = range(stop - 1, start - 1, -1) if reverse else range(start, stop)
+        for i in indices:
+            yield self.keys_[i], self.values_[i]
+
+    def __len__(self):
+        return len(self.keys_)
+
+    def close(self):
+        self.snapshot.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+
+    import os
+    import tempfile
+
+    from RBTree import RBTree
+
+    tree = RBTree()
+    for key in [5, 3, 8, 1]:
+        tree.insert(key)
+    tree.insert(4, "vier")
+    tree.insert(9, "neun")
+
+    path = os.path.join(tempfile.mkdtemp(), "rbtree.ads")
+    tree.save(path)
+
+    loaded = RBTree.load(path)
+    assert list(loaded.items()) == list(tree.items())
+    print(list(loaded.items()))
+
+    with RBTree.load(path, readonly=True) as view:
+        print(view.search(4), view.search(5), view.select(0))
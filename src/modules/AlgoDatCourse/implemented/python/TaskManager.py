@@ -1,6 +1,16 @@
 import heapq
+import queue
+import threading
+import time
+
+# Markiert Einträge, die nach update_priority/cancel nur noch als Leiche im Heap liegen
+REMOVED = None
+
 
 class Task:
+    # Kein __dict__ pro Aufgabe, bei Millionen wartender Aufgaben der größte Posten
+    __slots__ = ("name", "priority")
+
     def __init__(self, name: str, priority: int):
         self.name = name
         self.priority = priority
@@ -13,24 +23,191 @@ class TaskManager:
     """
     Pythons heapq ist wie Javas PriorityQueue intern ein MinHeap.
     Negierte Priorität simuliert einen MaxHeap (höchste Priorität zuerst).
+
+    add_task liefert eine task_id. update_priority und cancel laufen über
+    Lazy Invalidation in O(log n): der alte Heap-Eintrag wird nur als
+    REMOVED markiert und beim Entnehmen übersprungen; machen die Leichen
+    mehr als die Hälfte des Heaps aus, wird er kompaktiert.
+
+    Mit aging > 0 steigt die Priorität einer wartenden Aufgabe um aging pro
+    Sekunde. Die virtuelle Priorität priority + aging * (jetzt - eingereiht)
+    ordnet zwei Aufgaben unabhängig von "jetzt" gleich, daher genügt der
+    feste Schlüssel -priority + aging * eingereiht, ohne den Heap je neu zu
+    durchlaufen.
     """
-    def __init__(self):
-        self._heap: list[tuple[int, int, Task]] = []
+    COMPACT_MIN = 64
+
+    def __init__(self, aging: float = 0.0, clock=time.monotonic):
+        # [schlüssel, counter, task_id, task, eingereiht]; Listen, damit task ungültig gesetzt werden kann
+        self._heap: list[list] = []
+        self._entries: dict[int, list] = {}
         self._counter = 0  # Tie-breaker bei gleicher Priorität
+        self._stale = 0
+        self.aging = aging
+        self._clock = clock
+        self._epoch = clock()
+
+    def add_task(self, name: str, priority: int) -> int:
+        return self._push(Task(name, priority))
 
-    def add_task(self, name: str, priority: int) -> None:
-        task = Task(name, priority)
-        heapq.heappush(self._heap, (-priority, self._counter, task))
+    def _push(self, task: Task, task_id: int | None = None, enqueued: float | None = None) -> int:
+        if task_id is None:
+            task_id = self._counter
+        if enqueued is None:
+            enqueued = self._clock() - self._epoch if self.aging else 0.0
+        key = -task.priority + self.aging * enqueued if self.aging else -task.priority
+        entry = [key, self._counter, task_id, task, enqueued]
         self._counter += 1
+        self._entries[task_id] = entry
+        heapq.heappush(self._heap, entry)
+        return task_id
 
     def get_next_task(self) -> Task:
-        return heapq.heappop(self._heap)[2]
+        return self._pop_entry()[3]
+
+    def _pop_entry(self) -> list:
+        while True:
+            entry = heapq.heappop(self._heap)  # IndexError bei leerem Heap
+            if entry[3] is not REMOVED:
+                del self._entries[entry[2]]
+                return entry
+            self._stale -= 1
 
     def peek_task(self) -> Task:
-        return self._heap[0][2]
+        while self._heap[0][3] is REMOVED:
+            heapq.heappop(self._heap)
+            self._stale -= 1
+        return self._heap[0][3]
+
+    def update_priority(self, task_id: int, priority: int) -> None:
+        """Neue Priorität; bei Gleichstand reiht sich die Aufgabe hinter die bereits wartenden ein."""
+        entry = self._invalidate(task_id)
+        task = entry[3]
+        task.priority = priority
+        self._push(task, task_id, entry[4])
+
+    def cancel(self, task_id: int) -> Task:
+        return self._invalidate(task_id)[3]
+
+    def _invalidate(self, task_id: int) -> list:
+        entry = self._entries.pop(task_id, None)
+        if entry is None:
+            raise KeyError(f"Unbekannte oder bereits entnommene Aufgabe: {task_id}")
+        # Kopie für den Aufrufer, im Heap bleibt die markierte Leiche
+        live = list(entry)
+        entry[3] = REMOVED
+        self._stale += 1
+        if self._stale > self.COMPACT_MIN and 2 * self._stale > len(self._heap):
+            self._compact()
+        return live
+
+    def _compact(self) -> None:
+        self._heap = [entry for entry in self._heap if entry[3] is not REMOVED]
+        heapq.heapify(self._heap)
+        self._stale = 0
 
     def is_empty(self) -> bool:
-        return len(self._heap) == 0
+        return len(self._entries) == 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ConcurrentTaskManager(TaskManager):
+    """
+    Threadsichere Variante für viele Producer und Worker. Ein Lock schützt
+    den Heap, zwei Bedingungsvariablen darauf ersetzen das Pollen von
+    is_empty(): get() schläft, bis eine Aufgabe da ist, put() schläft, bis
+    wieder Platz ist (maxsize > 0). task_done()/join() wie bei queue.Queue.
+    Leer/voll nach Ablauf des Timeouts: queue.Empty bzw. queue.Full.
+    """
+    def __init__(self, maxsize: int = 0, aging: float = 0.0, clock=time.monotonic):
+        super().__init__(aging, clock)
+        self.maxsize = maxsize
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+        self._all_done = threading.Condition(self._mutex)
+        self._unfinished = 0
+
+    def put(self, name: str, priority: int, block: bool = True, timeout: float | None = None) -> int:
+        with self._not_full:
+            if self.maxsize > 0:
+                def has_room():
+                    return len(self._entries) < self.maxsize
+
+                if not self._not_full.wait_for(has_room, timeout if block else 0):
+                    raise queue.Full
+            task_id = super().add_task(name, priority)
+            self._unfinished += 1
+            self._not_empty.notify()
+            return task_id
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Task:
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self._entries, timeout if block else 0):
+                raise queue.Empty
+            task = super().get_next_task()
+            self._not_full.notify()
+            return task
+
+    def drain(self, max_n: int) -> list[Task]:
+        """Bis zu max_n Aufgaben in Prioritätsreihenfolge, alle unter einer Lock-Aufnahme."""
+        with self._mutex:
+            n = min(max_n, len(self._entries))
+            tasks = [self._pop_entry()[3] for _ in range(n)]
+            if n:
+                self._not_full.notify(n)
+            return tasks
+
+    def task_done(self) -> None:
+        with self._all_done:
+            if self._unfinished <= 0:
+                raise ValueError("task_done() zu oft aufgerufen")
+            self._unfinished -= 1
+            if self._unfinished == 0:
+                self._all_done.notify_all()
+
+    def join(self) -> None:
+        """Blockiert, bis für jede eingestellte Aufgabe task_done() aufgerufen wurde."""
+        with self._all_done:
+            self._all_done.wait_for(lambda: self._unfinished == 0)
+
+    # Die Methoden von TaskManager bleiben nutzbar, jetzt unter dem Lock
+    def add_task(self, name: str, priority: int) -> int:
+        return self.put(name, priority)
+
+    def get_next_task(self) -> Task:
+        with self._mutex:
+            task = super().get_next_task()
+            self._not_full.notify()
+            return task
+
+    def peek_task(self) -> Task:
+        with self._mutex:
+            return super().peek_task()
+
+    def update_priority(self, task_id: int, priority: int) -> None:
+        with self._mutex:
+            super().update_priority(task_id, priority)
+
+    def cancel(self, task_id: int) -> Task:
+        """Entfernt die Aufgabe; für join() zählt sie damit als erledigt."""
+        with self._mutex:
+            task = super().cancel(task_id)
+            self._not_full.notify()
+            self._unfinished -= 1
+            if self._unfinished == 0:
+                self._all_done.notify_all()
+            return task
+
+    def is_empty(self) -> bool:
+        with self._mutex:
+            return super().is_empty()
+
+    def qsize(self) -> int:
+        with self._mutex:
+            return len(self._entries)
 
 
 if __name__ == "__main__":
@@ -39,7 +216,12 @@ if __name__ == "__main__":
     manager.add_task("Server neu starten", 10)
     manager.add_task("Hauspost wegbringen", 7)
     manager.add_task("Essensmarken besorgen", 1)
-    manager.add_task("Backup durchführen", 5)
+
+    backup = manager.add_task("Backup durchführen", 5)
+    post = manager.add_task("Post sortieren", 3)
+
+    manager.update_priority(backup, 8)
+    manager.cancel(post)
 
     print("Nächste Aufgabe:", manager.peek_task())
     print()